@@ -1,7 +1,24 @@
+import numpy as np
 from spacy.tokens import Doc, Span
 
 
 class Chunk:
+    # Documents hold thousands of chunks, slots avoid a __dict__ per chunk
+    __slots__ = (
+        "source",
+        "_content",
+        "title",
+        "chunk_id",
+        "vector",
+        "doc_uuid",
+        "pca",
+        "start_i",
+        "end_i",
+        "overlap_end",
+        "_content_without_overlap",
+        "labels",
+    )
+
     def __init__(
         self,
         content: str = "",
@@ -9,8 +26,12 @@ class Chunk:
         chunk_id: str = "",
         start_i: int = 0,
         end_i: int = 0,
+        source: str | None = None,
+        overlap_end: int | None = None,
     ):
-        self.content = content
+        # Chunks created with a source are views, their text is sliced from source[start_i:end_i] on access
+        self.source = source
+        self._content = content
         self.title = ""
         self.chunk_id = chunk_id
         self.vector = None
@@ -18,9 +39,57 @@ class Chunk:
         self.pca = [0, 0, 0]
         self.start_i = start_i
         self.end_i = end_i
-        self.content_without_overlap = content_without_overlap
+        self.overlap_end = end_i if overlap_end is None else overlap_end
+        self._content_without_overlap = content_without_overlap
         self.labels = []
 
+    @classmethod
+    def from_offsets(
+        cls,
+        source: str,
+        chunk_id: int,
+        start: int,
+        end: int,
+        overlap_end: int | None = None,
+    ):
+        """Create a Chunk as view over the shared source text, source[start:overlap_end] is the content without overlap"""
+        return cls(
+            chunk_id=chunk_id,
+            start_i=start,
+            end_i=end,
+            source=source,
+            overlap_end=overlap_end,
+        )
+
+    @property
+    def content(self) -> str:
+        if self.source is not None:
+            return self.source[self.start_i : self.end_i]
+        return self._content
+
+    @content.setter
+    def content(self, content: str):
+        self.materialize()
+        self._content = content
+
+    @property
+    def content_without_overlap(self) -> str:
+        if self.source is not None:
+            return self.source[self.start_i : self.overlap_end]
+        return self._content_without_overlap
+
+    @content_without_overlap.setter
+    def content_without_overlap(self, content_without_overlap: str):
+        self.materialize()
+        self._content_without_overlap = content_without_overlap
+
+    def materialize(self):
+        """Copy the text out of the shared source, the Chunk no longer references it afterwards"""
+        if self.source is not None:
+            self._content = self.source[self.start_i : self.end_i]
+            self._content_without_overlap = self.source[self.start_i : self.overlap_end]
+            self.source = None
+
     def to_json(self) -> dict:
         """Convert the Chunk object to a dictionary."""
         return {
@@ -28,7 +97,7 @@ class Chunk:
             "chunk_id": self.chunk_id,
             "doc_uuid": self.doc_uuid,
             "title": self.title,
-            "pca": self.pca,
+            "pca": [float(value) for value in self.pca],
             "start_i": self.start_i,
             "end_i": self.end_i,
             "content_without_overlap": self.content_without_overlap,
@@ -49,3 +118,120 @@ class Chunk:
         )
         chunk.doc_uuid = (data.get("doc_uuid", ""),)
         return chunk
+
+
+class ChunkVectors:
+    """
+    Vectors of all chunks of a document as one contiguous float32 matrix, row i belongs to the i-th chunk.
+    Chunks only reference rows of the matrix, the Weaviate client converts a row to Python floats only while sending it.
+    """
+
+    __slots__ = ("matrix", "pca")
+
+    def __init__(self, matrix: np.ndarray, pca: np.ndarray | None = None):
+        self.matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        self.pca = pca
+
+    @classmethod
+    def from_rows(cls, rows: list) -> "ChunkVectors":
+        """Create the matrix from embeddings (lists or arrays), the rows can be released afterwards"""
+        if len(rows) == 0:
+            # Documents without chunks get an empty matrix, not a 1-D array
+            return cls(np.empty((0, 0), dtype=np.float32))
+        return cls(np.asarray(rows, dtype=np.float32))
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+    @property
+    def dimensions(self) -> int:
+        return self.matrix.shape[1]
+
+    def assign(self, chunks: list[Chunk]):
+        """Point the vector and pca of every chunk to its row"""
+        if len(chunks) != len(self):
+            raise Exception(
+                f"Vector count mismatch: {len(self)} vectors for {len(chunks)} chunks"
+            )
+        for i, chunk in enumerate(chunks):
+            chunk.vector = self.matrix[i]
+            if self.pca is not None:
+                chunk.pca = self.pca[i]
+
+
+def locate_chunks(
+    source: str, texts: list[str], overlap: int = 0
+) -> list[tuple[int, int] | None]:
+    """Find the character offsets of chunk texts created by a text splitter in the source.
+    Texts that aren't part of the source (e.g. stripped or prefixed with headers) are located by their first and last line.
+    Returns None for texts that can't be found.
+    """
+    offsets = []
+    # Chunks are in order, the next chunk can't start before the overlap of the previous one
+    cursor = 0
+    for text in texts:
+        start = source.find(text, cursor) if text else -1
+        if start != -1:
+            end = start + len(text)
+        else:
+            lines = [line.strip() for line in text.splitlines() if line.strip()]
+            start = source.find(lines[0], cursor) if lines else -1
+            end = source.find(lines[-1], start) if start != -1 else -1
+            if end == -1:
+                offsets.append(None)
+                continue
+            end += len(lines[-1])
+        offsets.append((start, end))
+        cursor = max(start + 1, end - overlap)
+    return offsets
+
+
+def create_chunks(
+    source: str,
+    texts: list[str],
+    overlap: int = 0,
+    anchors: list[str] | None = None,
+) -> list[Chunk]:
+    """Create chunks with exact character offsets from the texts of a text splitter.
+    Texts that are part of the source become views, other texts keep their own content.
+    Anchors are located instead of the texts if given, e.g. the content of a chunk without added headers.
+    """
+    offsets = locate_chunks(source, texts if anchors is None else anchors, overlap)
+    chunks = []
+    for i, (text, offset) in enumerate(zip(texts, offsets)):
+        if offset is None:
+            chunks.append(
+                Chunk(
+                    content=text,
+                    chunk_id=i,
+                    start_i=None,
+                    end_i=None,
+                    content_without_overlap=text,
+                )
+            )
+            continue
+
+        start, end = offset
+        if source[start:end] != text:
+            chunks.append(
+                Chunk(
+                    content=text,
+                    chunk_id=i,
+                    start_i=start,
+                    end_i=end,
+                    content_without_overlap=text,
+                )
+            )
+            continue
+
+        # The part without overlap ends where the next chunk starts
+        next_offset = offsets[i + 1] if i + 1 < len(offsets) else None
+        overlap_end = (
+            end if next_offset is None else min(max(next_offset[0], start), end)
+        )
+        chunks.append(
+            Chunk.from_offsets(
+                source, chunk_id=i, start=start, end=end, overlap_end=overlap_end
+            )
+        )
+    return chunks
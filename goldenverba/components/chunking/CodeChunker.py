@@ -6,7 +6,7 @@ with contextlib.suppress(Exception):
         RecursiveCharacterTextSplitter,
     )
 
-from goldenverba.components.chunk import Chunk
+from goldenverba.components.chunk import create_chunks
 from goldenverba.components.interfaces import Chunker
 from goldenverba.components.document import Document
 from goldenverba.components.types import InputConfig
@@ -66,25 +66,13 @@ class CodeChunker(Chunker):
             if len(document.chunks) > 0:
                 continue
 
-            char_end_i = -1
-            for i, chunk in enumerate(text_splitter.split_text(document.content)):
-
-                if chunk_overlap == 0:
-                    char_start_i = char_end_i + 1
-                    char_end_i = char_start_i + len(chunk)
-                else:
-                    # not implemented, requires complex calculations as to whether the overlap contained a 'good' chunk
-                    char_start_i = None
-                    char_end_i = None
-
-                document.chunks.append(
-                    Chunk(
-                        content=chunk,
-                        chunk_id=i,
-                        start_i=char_start_i,
-                        end_i=char_end_i,
-                        content_without_overlap=chunk,
-                    )
+            # Chunks are located in the document content to store their exact offsets
+            document.chunks.extend(
+                create_chunks(
+                    document.content,
+                    text_splitter.split_text(document.content),
+                    chunk_overlap,
                 )
+            )
 
         return documents
@@ -3,7 +3,7 @@ import contextlib
 with contextlib.suppress(Exception):
     from langchain_text_splitters import HTMLHeaderTextSplitter
 
-from goldenverba.components.chunk import Chunk
+from goldenverba.components.chunk import create_chunks
 from goldenverba.components.interfaces import Chunker
 from goldenverba.components.document import Document
 from goldenverba.components.interfaces import Embedding
@@ -43,7 +43,9 @@ class HTMLChunker(Chunker):
             if len(document.chunks) > 0:
                 continue
 
-            for i, chunk in enumerate(text_splitter.split_text(document.content)):
+            chunk_texts = []
+            anchors = []
+            for chunk in text_splitter.split_text(document.content):
 
                 chunk_text = ""
 
@@ -53,15 +55,12 @@ class HTMLChunker(Chunker):
 
                 # append page content (always there)
                 chunk_text += chunk.page_content
+                chunk_texts.append(chunk_text)
+                anchors.append(chunk.page_content)
 
-                document.chunks.append(
-                    Chunk(
-                        content=chunk_text,
-                        chunk_id=i,
-                        start_i=None,  # not implemented as HTML text splitter changes the actual document (removes tags)
-                        end_i=None,
-                        content_without_overlap=chunk_text,
-                    )
-                )
+            # The HTML text splitter removes tags, chunks keep their text and store the offsets of the HTML they were extracted from
+            document.chunks.extend(
+                create_chunks(document.content, chunk_texts, anchors=anchors)
+            )
 
         return documents
@@ -1,11 +1,5 @@
-import contextlib
-
-import json
-
-with contextlib.suppress(Exception):
-    from langchain_text_splitters import (
-        RecursiveJsonSplitter,
-    )
+import re
+from typing import Iterator
 
 from goldenverba.components.chunk import Chunk
 from goldenverba.components.interfaces import Chunker
@@ -13,17 +7,115 @@ from goldenverba.components.document import Document
 from goldenverba.components.types import InputConfig
 from goldenverba.components.interfaces import Embedding
 
+# Strings, structural characters and scalars (numbers, true, false, null) of JSON text
+JSON_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]{},:]|[^\s\[\]{},:"]+')
+
+
+def iter_values(content: str, start: int, end: int) -> Iterator[tuple[int, int, int]]:
+    """Yield (start, value_start, end) of every value in content[start:end] without parsing it.
+    Values are separated by commas (inside arrays and objects) or whitespace (JSON Lines),
+    object members span from their key to the end of their value.
+    """
+    depth = 0
+    span_start = value_start = span_end = None
+    after_key = False
+    for match in JSON_TOKEN.finditer(content, start, end):
+        token = match.group()
+        if depth > 0:
+            if token in "[{":
+                depth += 1
+            elif token in "]}":
+                depth -= 1
+                if depth == 0:
+                    span_end = match.end()
+            continue
+
+        if token == ",":
+            if span_start is not None:
+                yield span_start, value_start, span_end
+            span_start = None
+            continue
+        if token == ":":
+            after_key = True
+            continue
+
+        if span_start is not None and not after_key:
+            # Values only separated by whitespace, e.g. records of JSON Lines
+            yield span_start, value_start, span_end
+            span_start = None
+        if span_start is None:
+            span_start = match.start()
+        value_start = match.start()
+        span_end = match.end()
+        after_key = False
+        if token in "[{":
+            depth += 1
+
+    if span_start is not None:
+        yield span_start, value_start, span_end
+
+
+def iter_chunks(
+    content: str,
+    start: int,
+    end: int,
+    chunk_size: int,
+    path: tuple[tuple[str | None, str], ...] = (),
+) -> Iterator[tuple[int, int, tuple[tuple[str | None, str], ...]]]:
+    """Yield (start, end, path) of chunks, consecutive values are grouped up to chunk_size characters.
+    Arrays and objects larger than chunk_size are split by their own values,
+    path holds the key (None inside arrays) and opening bracket of every container the chunk lies in.
+    """
+    group_start = group_end = None
+    for value_start_i, value_start, value_end in iter_values(content, start, end):
+        if value_end - value_start_i > chunk_size and content[value_start] in "[{":
+            if group_start is not None:
+                yield group_start, group_end, path
+                group_start = None
+            key = None
+            if value_start != value_start_i:
+                key = JSON_TOKEN.match(content, value_start_i).group()
+            yield from iter_chunks(
+                content,
+                value_start + 1,
+                value_end - 1,
+                chunk_size,
+                path + ((key, content[value_start]),),
+            )
+            continue
+
+        if group_start is not None and value_end - group_start > chunk_size:
+            yield group_start, group_end, path
+            group_start = None
+        if group_start is None:
+            group_start = value_start_i
+        group_end = value_end
+
+    if group_start is not None:
+        yield group_start, group_end, path
+
+
+def wrap_chunk(
+    content: str, start: int, end: int, path: tuple[tuple[str | None, str], ...]
+) -> str:
+    """Wrap content[start:end] in the containers of its path, e.g. {"server": {"db": {"port": 5}}}"""
+    text = content[start:end]
+    for key, bracket in reversed(path):
+        text = bracket + text + ("}" if bracket == "{" else "]")
+        if key is not None:
+            text = key + ": " + text
+    return text
+
 
 class JSONChunker(Chunker):
     """
-    JSONChunker for Verba using LangChain.
+    JSONChunker for Verba, streams through JSON and JSON Lines content.
     """
 
     def __init__(self):
         super().__init__()
         self.name = "JSON"
-        self.requires_library = ["langchain_text_splitters"]
-        self.description = "Split json files using LangChain"
+        self.description = "Split JSON and JSON Lines files record by record without loading them at once"
         self.config = {
             "Chunk Size": InputConfig(
                 type="number",
@@ -43,30 +135,30 @@ class JSONChunker(Chunker):
 
         units = int(config["Chunk Size"].value)
 
-        text_splitter = RecursiveJsonSplitter(max_chunk_size=units)
-
         for document in documents:
 
-            json_obj = json.loads(document.content)
-
             # Skip if document already contains chunks
             if len(document.chunks) > 0:
                 continue
 
-            char_end_i = -1
-            for i, chunk in enumerate(text_splitter.split_text(json_obj)):
-
-                char_start_i = char_end_i + 1
-                char_end_i = char_start_i + len(chunk)
-
-                document.chunks.append(
-                    Chunk(
-                        content=chunk,
+            # Top level records are views on the document content, the JSON is never parsed into objects.
+            # Parts of split arrays and objects are wrapped in their key path, so they stay valid JSON.
+            for i, (start, end, path) in enumerate(
+                iter_chunks(document.content, 0, len(document.content), units)
+            ):
+                if not path:
+                    chunk = Chunk.from_offsets(
+                        document.content, chunk_id=i, start=start, end=end
+                    )
+                else:
+                    text = wrap_chunk(document.content, start, end, path)
+                    chunk = Chunk(
+                        content=text,
+                        content_without_overlap=text,
                         chunk_id=i,
-                        start_i=None,  # not implemented as the splitter modifies the outputs
-                        end_i=None,
-                        content_without_overlap=chunk,
+                        start_i=start,
+                        end_i=end,
                     )
-                )
+                document.chunks.append(chunk)
 
         return documents
@@ -4,7 +4,7 @@ with contextlib.suppress(Exception):
     from langchain_text_splitters import MarkdownHeaderTextSplitter
     from langchain_core.documents import Document as LangChainDocument
 
-from goldenverba.components.chunk import Chunk
+from goldenverba.components.chunk import create_chunks
 from goldenverba.components.interfaces import Chunker
 from goldenverba.components.document import Document
 from goldenverba.components.interfaces import Embedding
@@ -59,14 +59,15 @@ class MarkdownChunker(Chunker):
             headers_to_split_on=HEADERS_TO_SPLIT_ON
         )
 
-        char_end_i = -1
         for document in documents:
 
             # Skip if document already contains chunks
             if len(document.chunks) > 0:
                 continue
 
-            for i, split_doc in enumerate(text_splitter.split_text(document.content)):
+            chunk_texts = []
+            anchors = []
+            for split_doc in text_splitter.split_text(document.content):
 
                 chunk_text = ""
 
@@ -77,18 +78,12 @@ class MarkdownChunker(Chunker):
 
                 # append page content (always there)
                 chunk_text += split_doc.page_content
+                chunk_texts.append(chunk_text)
+                anchors.append(split_doc.page_content)
 
-                char_start_i = char_end_i + 1
-                char_end_i = char_start_i + len(chunk_text)
-
-                document.chunks.append(
-                    Chunk(
-                        content=chunk_text,
-                        chunk_id=i,
-                        start_i=None,  # not implemented as text splitter augments the document
-                        end_i=None,
-                        content_without_overlap=chunk_text,
-                    )
-                )
+            # Chunks are augmented with their headers, they keep their text and store the offsets of their section content
+            document.chunks.extend(
+                create_chunks(document.content, chunk_texts, anchors=anchors)
+            )
 
         return documents
@@ -3,7 +3,7 @@ import contextlib
 with contextlib.suppress(Exception):
     from langchain_text_splitters import RecursiveCharacterTextSplitter
 
-from goldenverba.components.chunk import Chunk
+from goldenverba.components.chunk import create_chunks
 from goldenverba.components.interfaces import Chunker
 from goldenverba.components.document import Document
 from goldenverba.components.types import InputConfig
@@ -81,27 +81,13 @@ class RecursiveChunker(Chunker):
             if len(document.chunks) > 0:
                 continue
 
-            # char_end_i = -1
-            for i, chunk in enumerate(text_splitter.split_text(document.content)):
-
-                # leavingt this commented because this _does_ work but the text splitter strips whitespace and therefore modifies the original doc
-                # if overlap == 0:
-                #     char_start_i = char_end_i + 1
-                #     char_end_i = char_start_i + len(chunk)
-                # else:
-
-                # not implemented because it uses intelligent chunking to find start of token
-                char_start_i = None
-                char_end_i = None
-
-                document.chunks.append(
-                    Chunk(
-                        content=chunk,
-                        chunk_id=i,
-                        start_i=char_start_i,
-                        end_i=char_end_i,
-                        content_without_overlap=chunk,
-                    )
+            # Chunks are located in the document content to store their exact offsets
+            document.chunks.extend(
+                create_chunks(
+                    document.content,
+                    text_splitter.split_text(document.content),
+                    overlap,
                 )
+            )
 
         return documents
@@ -1,10 +1,5 @@
-import contextlib
-
 from wasabi import msg
 
-with contextlib.suppress(Exception):
-    from sklearn.metrics.pairwise import cosine_similarity
-
 from goldenverba.components.chunk import Chunk
 from goldenverba.components.interfaces import Chunker
 from goldenverba.components.document import Document
@@ -22,7 +17,8 @@ class SemanticChunker(Chunker):
     def __init__(self):
         super().__init__()
         self.name = "Semantic"
-        self.requires_library = ["sklearn"]
+        self.requires_spacy = True
+        self.requires_embedder = True
         self.description = (
             "Split documents based on semantic similarity or max sentences"
         )
@@ -39,6 +35,18 @@ class SemanticChunker(Chunker):
                 description="Maximum number of sentences per chunk",
                 values=[],
             ),
+            "Reuse Sentence Embeddings": InputConfig(
+                type="bool",
+                value=False,
+                description="Use the mean of the sentence embeddings as chunk vectors instead of embedding chunks again",
+                values=[],
+            ),
+            "Max Pooled Sentences": InputConfig(
+                type="number",
+                value=5,
+                description="Chunks with more sentences are embedded again when reusing sentence embeddings (0 to reuse for all chunks)",
+                values=[],
+            ),
         }
 
     async def chunk(
@@ -63,7 +71,12 @@ class SemanticChunker(Chunker):
 
             # Use spaCy's sentence segmentation
             sentences = [
-                {"sentence": sent.text, "index": i}
+                {
+                    "sentence": sent.text,
+                    "index": i,
+                    "start": sent.start_char,
+                    "end": sent.end_char,
+                }
                 for i, sent in enumerate(document.spacy_doc.sents)
             ]
             sentences = self.combine_sentences(sentences)
@@ -71,76 +84,86 @@ class SemanticChunker(Chunker):
             # If there's only one sentence, create a single chunk
             if len(sentences) == 1:
                 document.chunks.append(
-                    Chunk(
-                        content=sentences[0]["sentence"],
+                    Chunk.from_offsets(
+                        document.content,
                         chunk_id=0,
-                        start_i=0,
-                        end_i=len(document.content),
-                        content_without_overlap=sentences[0]["sentence"]
+                        start=0,
+                        end=len(document.content),
                     )
                 )
                 continue
 
             msg.info(f"Generated {len(sentences)} sentences")
 
-            embeddings = await embedder.vectorize(
+            # Batched by the Embedder to respect its batch size and concurrency limits
+            embeddings = await embedder.batch_vectorize(
                 embedder_config, [x["combined_sentence"] for x in sentences]
             )
 
             msg.info(f"Generated {len(embeddings)} embeddings")
 
-            for i, sentence in enumerate(sentences):
-                sentence["combined_sentence_embedding"] = embeddings[i]
-
-            distances, sentences = self.calculate_cosine_distances(sentences)
+            distances = self.calculate_cosine_distances(embeddings)
 
             breakpoint_distance_threshold = np.percentile(
                 distances, breakpoint_percentile_threshold
             )
 
-            chunks = []
-            current_chunk = []
-            char_is = []
-            sentence_count = 0
-            char_end_i = -1
-            for i, sentence in enumerate(sentences):
-                current_chunk.append(sentence["sentence"])
-                sentence_count += 1
-
+            # First and last (exclusive) sentence of every chunk
+            chunk_ranges = []
+            chunk_start = 0
+            for i in range(len(sentences)):
                 # new chunk found (distance breakpoint not reached or reached max sentences)
                 if (
                     i < len(distances) and distances[i] > breakpoint_distance_threshold
-                ) or sentence_count >= max_sentences:
-                    
-                    chunk_text = " ".join(current_chunk)
-                    chunks.append(chunk_text)
-
-                    char_start_i = char_end_i + 1
-                    char_end_i = char_start_i + len(chunk_text)
-                    char_is.append((char_start_i, char_end_i))
-
-                    current_chunk = []
-                    sentence_count = 0
+                ) or i + 1 - chunk_start >= max_sentences:
+                    chunk_ranges.append((chunk_start, i + 1))
+                    chunk_start = i + 1
 
             # Add any remaining sentences as the last chunk
-            if current_chunk:
-                chunk_text = " ".join(current_chunk)
-                chunks.append(chunk_text)
-                char_is.append((char_end_i + 1, char_end_i + 1 + len(chunk_text)))
+            if chunk_start < len(sentences):
+                chunk_ranges.append((chunk_start, len(sentences)))
 
-            for i, chunk in enumerate(chunks):
+            # Chunks are sliced from the document content by their sentence offsets
+            for i, (first, last) in enumerate(chunk_ranges):
                 document.chunks.append(
-                    Chunk(
-                        content=chunk,
+                    Chunk.from_offsets(
+                        document.content,
                         chunk_id=i,
-                        start_i=char_is[i][0],
-                        end_i=char_is[i][1],
-                        content_without_overlap=chunk,
+                        start=sentences[first]["start"],
+                        end=sentences[last - 1]["end"],
                     )
                 )
 
+            if config["Reuse Sentence Embeddings"].value:
+                self.pool_chunk_vectors(
+                    document,
+                    embeddings,
+                    chunk_ranges,
+                    int(config["Max Pooled Sentences"].value),
+                )
+
         return documents
 
+    def pool_chunk_vectors(
+        self,
+        document: Document,
+        embeddings: list[list[float]],
+        chunk_ranges: list[tuple[int, int]],
+        max_pooled_sentences: int,
+    ):
+        """Store the normalized mean of the sentence embeddings of a chunk as its vector.
+        Chunks with more than max_pooled_sentences sentences are left to the EmbeddingManager.
+        """
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        for chunk_id, (start, end) in enumerate(chunk_ranges):
+            if max_pooled_sentences > 0 and end - start > max_pooled_sentences:
+                continue
+            vector = matrix[start:end].mean(axis=0)
+            norm = np.linalg.norm(vector)
+            if norm > 0:
+                vector /= norm
+            document.chunk_vectors[chunk_id] = vector
+
     def combine_sentences(self, sentences, buffer_size=1):
         # Go through each sentence dict
         for i in range(len(sentences)):
@@ -171,25 +194,11 @@ class SemanticChunker(Chunker):
 
         return sentences
 
-    def calculate_cosine_distances(self, sentences):
-        distances = []
-        for i in range(len(sentences) - 1):
-            embedding_current = sentences[i]["combined_sentence_embedding"]
-            embedding_next = sentences[i + 1]["combined_sentence_embedding"]
-
-            # Calculate cosine similarity
-            similarity = cosine_similarity([embedding_current], [embedding_next])[0][0]
-
-            # Convert to cosine distance
-            distance = 1 - similarity
-
-            # Append cosine distance to the list
-            distances.append(distance)
-
-            # Store distance in the dictionary
-            sentences[i]["distance_to_next"] = distance
-
-        # Optionally handle the last sentence
-        # sentences[-1]['distance_to_next'] = None  # or a default value
-
-        return distances, sentences
+    def calculate_cosine_distances(self, embeddings: list[list[float]]) -> np.ndarray:
+        """Cosine distance between every embedding and the next one"""
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        # Zero vectors have no direction, treat them as not similar to anything
+        matrix = matrix / np.where(norms == 0, 1, norms)
+        similarities = np.einsum("ij,ij->i", matrix[:-1], matrix[1:])
+        return 1 - similarities
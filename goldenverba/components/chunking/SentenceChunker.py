@@ -1,4 +1,5 @@
 from wasabi import msg
+import numpy as np
 
 from goldenverba.components.chunk import Chunk
 from goldenverba.components.interfaces import Chunker
@@ -7,6 +8,33 @@ from goldenverba.components.types import InputConfig
 from goldenverba.components.interfaces import Embedding
 
 
+def get_chunk_offsets(
+    sentence_offsets: np.ndarray, units: int, overlap: int
+) -> list[tuple[int, int, int]]:
+    """Return (start, end, overlap_end) character offsets of all chunks.
+    Every chunk spans units sentences and shares overlap sentences with the next chunk.
+    """
+    sentence_count = len(sentence_offsets)
+    starts = np.arange(0, sentence_count, units - overlap)
+    ends = np.minimum(starts + units, sentence_count)
+
+    # The first chunk reaching the last sentence is the last chunk
+    last = int(np.argmax(ends == sentence_count))
+    starts, ends = starts[: last + 1], ends[: last + 1]
+    # The part without overlap ends where the next chunk starts, so these parts tile the content
+    overlap_ends = np.append(
+        sentence_offsets[starts[1:], 0], sentence_offsets[ends[-1] - 1, 1]
+    )
+
+    return list(
+        zip(
+            sentence_offsets[starts, 0].tolist(),
+            sentence_offsets[ends - 1, 1].tolist(),
+            overlap_ends.tolist(),
+        )
+    )
+
+
 class SentenceChunker(Chunker):
     """
     SentenceChunker for Verba built with spacy.
@@ -15,6 +43,7 @@ class SentenceChunker(Chunker):
     def __init__(self):
         super().__init__()
         self.name = "Sentence"
+        self.requires_spacy = True
         self.description = "Splits documents based on word tokens"
         self.config = {
             "Sentences": InputConfig(
@@ -44,23 +73,26 @@ class SentenceChunker(Chunker):
 
         for document in documents:
 
-            doc = document.spacy_doc
-
             # Skip if document already contains chunks
             if len(document.chunks) > 0:
                 continue
 
-            sentences = [sent.text for sent in doc.sents]
+            doc = document.spacy_doc
+
+            # Start and end character offsets of every sentence in the document content
+            sentence_offsets = np.array(
+                [(sent.start_char, sent.end_char) for sent in doc.sents],
+                dtype=np.int64,
+            ).reshape(-1, 2)
 
             # If Split Size is higher than actual Token Count or if Split Size is Zero
-            if units > len(sentences) or units == 0:
+            if units > len(sentence_offsets) or units == 0:
                 document.chunks.append(
-                    Chunk(
-                        content=document.content,
+                    Chunk.from_offsets(
+                        document.content,
                         chunk_id=0,
-                        start_i=0,
-                        end_i=len(document.content),
-                        content_without_overlap=document.content,
+                        start=0,
+                        end=len(document.content),
                     )
                 )
                 continue
@@ -71,41 +103,18 @@ class SentenceChunker(Chunker):
                 )
                 overlap = units - 1
 
-            i = 0
-            split_id_counter = 0
-            char_end_i = -1
-            while i < len(sentences):
-
-                # index at the sentence level
-                start_i = i
-                end_i = min(i + units, len(sentences))
-
-                overlap_start = max(0, end_i - overlap)
-                chunk_text = " ".join(sentences[start_i:end_i])
-                chunk_text_without_overlap = " ".join(sentences[start_i:overlap_start])
-
-                # need to convert to index at the character level
-                char_start_i = char_end_i + 1
-                if i > 0:
-                    char_start_i -= sum([len(s) for s in sentences[start_i:(start_i + overlap)]]) + 1
-                char_end_i = char_start_i + len(chunk_text)
-
-
-                doc_chunk = Chunk(
-                    content=chunk_text,
-                    chunk_id=split_id_counter,
-                    start_i=char_start_i,
-                    end_i=char_end_i,
-                    content_without_overlap=chunk_text_without_overlap,
+            for split_id_counter, (start, end, overlap_end) in enumerate(
+                get_chunk_offsets(sentence_offsets, units, overlap)
+            ):
+                # Chunks are sliced from the document content by exact character offsets
+                document.chunks.append(
+                    Chunk.from_offsets(
+                        document.content,
+                        chunk_id=split_id_counter,
+                        start=start,
+                        end=end,
+                        overlap_end=overlap_end,
+                    )
                 )
 
-                document.chunks.append(doc_chunk)
-                split_id_counter += 1
-
-                # Exit loop if this was the last possible chunk
-                if end_i == len(sentences):
-                    break
-
-                i += units - overlap  # Step forward, considering overlap
-
         return documents
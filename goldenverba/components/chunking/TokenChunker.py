@@ -1,4 +1,6 @@
 from wasabi import msg
+import numpy as np
+from spacy.tokens import Doc
 
 from goldenverba.components.chunk import Chunk
 from goldenverba.components.interfaces import Chunker
@@ -7,6 +9,36 @@ from goldenverba.components.types import InputConfig
 from goldenverba.components.interfaces import Embedding
 
 
+def get_token_offsets(doc: Doc) -> tuple[np.ndarray, np.ndarray]:
+    """Return start and end character offsets of all tokens"""
+    offsets = doc.to_array(["IDX", "LENGTH"]).astype(np.int64).reshape(-1, 2)
+    return offsets[:, 0], offsets[:, 0] + offsets[:, 1]
+
+
+def get_chunk_offsets(
+    token_starts: np.ndarray, token_ends: np.ndarray, units: int, overlap: int
+) -> list[tuple[int, int, int]]:
+    """Return (start, end, overlap_end) character offsets of all chunks.
+    Every chunk starts units tokens after the previous one and spans units + overlap tokens.
+    """
+    token_count = len(token_starts)
+    starts = np.arange(0, token_count, units)
+    ends = np.minimum(starts + units + overlap, token_count)
+
+    # The first chunk reaching the last token is the last chunk
+    last = int(np.argmax(ends == token_count))
+    starts, ends = starts[: last + 1], ends[: last + 1]
+    overlap_starts = np.where(ends == token_count, ends, starts + units)
+
+    return list(
+        zip(
+            token_starts[starts].tolist(),
+            token_ends[ends - 1].tolist(),
+            token_ends[overlap_starts - 1].tolist(),
+        )
+    )
+
+
 class TokenChunker(Chunker):
     """
     TokenChunker for Verba built with spacy.
@@ -15,6 +47,7 @@ class TokenChunker(Chunker):
     def __init__(self):
         super().__init__()
         self.name = "Token"
+        self.requires_spacy = True
         self.description = "Splits documents based on word tokens"
         self.config = {
             "Tokens": InputConfig(
@@ -44,21 +77,20 @@ class TokenChunker(Chunker):
 
         for document in documents:
 
-            doc = document.spacy_doc
-
             # Skip if document already contains chunks
             if len(document.chunks) > 0:
                 continue
 
+            doc = document.spacy_doc
+
             # If Split Size is higher than actual Token Count or if Split Size is Zero
             if units > len(doc) or units == 0:
                 document.chunks.append(
-                    Chunk(
-                        content=document.content,
+                    Chunk.from_offsets(
+                        document.content,
                         chunk_id=0,
-                        start_i=0,
-                        end_i=len(document.content),
-                        content_without_overlap=document.content,
+                        start=0,
+                        end=len(document.content),
                     )
                 )
                 continue
@@ -69,40 +101,20 @@ class TokenChunker(Chunker):
                 )
                 overlap = units - 1
 
-            i = 0
-            split_id_counter = 0
-            while i < len(doc):
-                start_i = i
-                end_i = min(i + units + overlap, len(doc))
-                if end_i == len(doc):
-                    overlap_start = end_i
-                else:
-                    overlap_start = min(i + units, end_i)
-
-                chunk_text = doc[start_i:end_i].text
-                chunk_text_without_overlap = doc[start_i:overlap_start].text
-
-                # char_start_i = doc[start_i].idx
-                if end_i == len(doc):
-                    char_end_i = doc[-1].idx + 1
-                else:
-                    char_end_i = doc[end_i].idx
-
-                doc_chunk = Chunk(
-                    content=chunk_text,
-                    chunk_id=split_id_counter,
-                    start_i=doc[start_i].idx,
-                    end_i=char_end_i,
-                    content_without_overlap=chunk_text_without_overlap,
+            # Character offsets of all tokens, read once instead of building a Span per chunk
+            token_starts, token_ends = get_token_offsets(doc)
+            for split_id_counter, (start, end, overlap_end) in enumerate(
+                get_chunk_offsets(token_starts, token_ends, units, overlap)
+            ):
+                # Chunks only keep character offsets into the document content
+                document.chunks.append(
+                    Chunk.from_offsets(
+                        document.content,
+                        chunk_id=split_id_counter,
+                        start=start,
+                        end=end,
+                        overlap_end=overlap_end,
+                    )
                 )
 
-                document.chunks.append(doc_chunk)
-                split_id_counter += 1
-
-                # Exit loop if this was the last possible chunk
-                if end_i == len(doc):
-                    break
-
-                i += units  # Step forward, considering overlap
-
         return documents
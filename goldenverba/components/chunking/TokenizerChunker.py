@@ -0,0 +1,209 @@
+import contextlib
+
+from wasabi import msg
+
+with contextlib.suppress(Exception):
+    import tiktoken
+
+from goldenverba.components.chunk import Chunk
+from goldenverba.components.interfaces import Chunker
+from goldenverba.components.document import Document
+from goldenverba.components.types import InputConfig
+from goldenverba.components.interfaces import Embedding
+from goldenverba.components.tokens import DEFAULT_ENCODING, get_encoding
+
+# Uses the tokenizer of the selected Embedder model if tiktoken knows it
+EMBEDDER_ENCODING = "Embedder Model"
+# Rounds of shrinking chunks that exceed the limit after re-encoding their text
+MAX_REFINEMENTS = 10
+
+
+def get_encoding_name(encoding: str, embedder_config: dict | None) -> str:
+    if encoding != EMBEDDER_ENCODING:
+        return encoding
+    if embedder_config is None or "Model" not in embedder_config:
+        return DEFAULT_ENCODING
+    try:
+        return tiktoken.encoding_name_for_model(embedder_config["Model"].value)
+    except KeyError:
+        return DEFAULT_ENCODING
+
+
+def plan_windows(
+    token_offsets: list[int], max_tokens: int, overlap: int, limits: dict[int, int]
+) -> list[tuple[int, int]]:
+    """Return (start, end) token windows, limits caps the size of the window starting at a token.
+    Windows start and end at the first token of a character, so no character is split between chunks.
+    """
+    token_count = len(token_offsets) - 1
+
+    def snap(i: int, lower: int) -> int:
+        while i > lower and token_offsets[i] == token_offsets[i - 1]:
+            i -= 1
+        return i
+
+    windows = []
+    start = 0
+    while True:
+        end = min(start + limits.get(start, max_tokens), token_count)
+        if end < token_count:
+            end = snap(end, start + 1)
+        windows.append((start, end))
+        if end == token_count:
+            return windows
+        start = snap(max(end - overlap, start + 1), start + 1)
+
+
+class TokenizerChunker(Chunker):
+    """
+    TokenizerChunker for Verba built with tiktoken, chunks never exceed the token limit of the embedding model.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.name = "Tokenizer"
+        self.requires_library = ["tiktoken"]
+        self.description = "Splits documents by model tokens with a guaranteed maximum token count per chunk"
+        self.config = {
+            "Encoding": InputConfig(
+                type="dropdown",
+                value=EMBEDDER_ENCODING,
+                description="Tokenizer used to count tokens, Embedder Model uses the tokenizer of the selected Embedder if available",
+                values=[EMBEDDER_ENCODING, "cl100k_base", "p50k_base", "r50k_base"],
+            ),
+            "Max Tokens": InputConfig(
+                type="number",
+                value=500,
+                description="Maximum amount of tokens per chunk",
+                values=[],
+            ),
+            "Overlap": InputConfig(
+                type="number",
+                value=50,
+                description="Choose how many tokens should overlap between chunks",
+                values=[],
+            ),
+        }
+
+    async def chunk(
+        self,
+        config: dict,
+        documents: list[Document],
+        embedder: Embedding | None = None,
+        embedder_config: dict | None = None,
+    ) -> list[Document]:
+
+        max_tokens = int(config["Max Tokens"].value)
+        overlap = int(config["Overlap"].value)
+        encoding = get_encoding(
+            get_encoding_name(config["Encoding"].value, embedder_config)
+        )
+
+        if max_tokens <= 0:
+            raise Exception("Max Tokens has to be greater than zero")
+
+        if overlap >= max_tokens:
+            msg.warn(
+                f"Overlap value is greater than unit (Max Tokens {max_tokens}/ Overlap {overlap})"
+            )
+            overlap = max_tokens - 1
+
+        # Skip if document already contains chunks
+        documents_to_chunk = [
+            document for document in documents if len(document.chunks) == 0
+        ]
+
+        # All documents are encoded at once, tiktoken encodes batches in parallel threads
+        document_tokens = encoding.encode_ordinary_batch(
+            [document.content for document in documents_to_chunk]
+        )
+
+        for document, tokens in zip(documents_to_chunk, document_tokens):
+            self.chunk_tokens(document, tokens, encoding, max_tokens, overlap)
+
+        return documents
+
+    def chunk_tokens(
+        self,
+        document: Document,
+        tokens: list[int],
+        encoding: "tiktoken.Encoding",
+        max_tokens: int,
+        overlap: int,
+    ):
+        if len(tokens) <= max_tokens:
+            document.chunks.append(
+                Chunk.from_offsets(
+                    document.content,
+                    chunk_id=0,
+                    start=0,
+                    end=len(document.content),
+                )
+            )
+            self.add_token_statistics(document, len(tokens), [len(tokens)])
+            return
+
+        # Character offset where every token starts, decoding is lossless for valid text
+        text, token_offsets = encoding.decode_with_offsets(tokens)
+        source = document.content if text == document.content else text
+        token_offsets.append(len(source))
+
+        # Text of a token window can encode to more tokens than the window (e.g. split characters),
+        # windows above the limit are shrunk and all following windows planned again
+        limits: dict[int, int] = {}
+        for _ in range(MAX_REFINEMENTS):
+            windows = plan_windows(token_offsets, max_tokens, overlap, limits)
+            offsets = [
+                (token_offsets[start], token_offsets[end]) for start, end in windows
+            ]
+            token_counts = [
+                len(chunk_tokens)
+                for chunk_tokens in encoding.encode_ordinary_batch(
+                    [source[start:end] for start, end in offsets]
+                )
+            ]
+            exceeding = [
+                (start, end, count)
+                for (start, end), count in zip(windows, token_counts)
+                if count > max_tokens
+            ]
+            if not exceeding:
+                break
+            for start, end, count in exceeding:
+                limits[start] = max(1, end - start - (count - max_tokens))
+        else:
+            raise Exception(
+                f"Couldn't split {document.title} into chunks of at most {max_tokens} tokens"
+            )
+
+        for i, (start, end) in enumerate(offsets):
+            # The part without overlap ends where the next chunk starts
+            overlap_end = offsets[i + 1][0] if i + 1 < len(offsets) else end
+            document.chunks.append(
+                Chunk.from_offsets(
+                    source,
+                    chunk_id=i,
+                    start=start,
+                    end=end,
+                    overlap_end=overlap_end,
+                )
+            )
+            # Decoded text differs from the content (e.g. invalid characters), chunks keep their own text
+            if source is not document.content:
+                document.chunks[-1].materialize()
+
+        self.add_token_statistics(document, len(tokens), token_counts)
+
+    def add_token_statistics(
+        self, document: Document, token_count: int, token_counts: list[int]
+    ):
+        statistics = {
+            "tokens": token_count,
+            "chunks": len(token_counts),
+            "max_tokens_per_chunk": max(token_counts),
+            "avg_tokens_per_chunk": round(sum(token_counts) / len(token_counts), 2),
+        }
+        document.meta["Token Statistics"] = statistics
+        msg.info(
+            f"Split {document.title} ({statistics['tokens']} tokens) into {statistics['chunks']} chunks with at most {statistics['max_tokens_per_chunk']} tokens"
+        )
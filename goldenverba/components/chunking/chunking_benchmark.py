@@ -0,0 +1,84 @@
+import asyncio
+import json
+import time
+
+from goldenverba.components.chunking.TokenChunker import TokenChunker
+from goldenverba.components.chunking.SentenceChunker import SentenceChunker
+from goldenverba.components.chunking.RecursiveChunker import RecursiveChunker
+from goldenverba.components.chunking.CodeChunker import CodeChunker
+from goldenverba.components.chunking.JSONChunker import JSONChunker
+from goldenverba.components.chunking.HTMLChunker import HTMLChunker
+from goldenverba.components.chunking.MarkdownChunker import MarkdownChunker
+from goldenverba.components.document import Document
+
+# Compares the import time (Document creation + chunking) per chunker with eager spaCy parsing
+# (the previous behaviour of Document.__init__) against lazy parsing on first access of spacy_doc.
+
+PARAGRAPHS = 2000
+
+SENTENCE = "Verba splits documents into chunks before they are embedded and imported into Weaviate. "
+
+
+def create_text() -> str:
+    return "\n\n".join(SENTENCE * 5 for _ in range(PARAGRAPHS))
+
+
+def create_markdown() -> str:
+    return "\n\n".join(
+        f"# Section {i}\n\n## Part {i}\n\n{SENTENCE * 5}" for i in range(PARAGRAPHS)
+    )
+
+
+def create_html() -> str:
+    return "".join(
+        f"<h1>Section {i}</h1><p>{SENTENCE * 5}</p>" for i in range(PARAGRAPHS)
+    )
+
+
+def create_code() -> str:
+    return "\n\n".join(
+        f'def function_{i}(value):\n    """{SENTENCE}"""\n    return value * {i}\n'
+        for i in range(PARAGRAPHS)
+    )
+
+
+def create_json() -> str:
+    return json.dumps(
+        {f"record_{i}": {"id": i, "text": SENTENCE * 2} for i in range(PARAGRAPHS)},
+        indent=2,
+    )
+
+
+BENCHMARKS = [
+    (TokenChunker, create_text),
+    (SentenceChunker, create_text),
+    (RecursiveChunker, create_text),
+    (CodeChunker, create_code),
+    (JSONChunker, create_json),
+    (HTMLChunker, create_html),
+    (MarkdownChunker, create_markdown),
+]
+
+
+async def import_document(chunker, content: str, eager: bool) -> float:
+    start_time = time.perf_counter()
+    document = Document(content=content)
+    if eager:
+        document.spacy_doc
+    await chunker.chunk(chunker.config, [document])
+    return time.perf_counter() - start_time
+
+
+async def run_chunking_benchmark():
+    print(f"{'Chunker':<12}{'Characters':>12}{'Eager (s)':>12}{'Lazy (s)':>12}")
+    for chunker_class, create_content in BENCHMARKS:
+        content = create_content()
+        eager = await import_document(chunker_class(), content, eager=True)
+        lazy = await import_document(chunker_class(), content, eager=False)
+        print(
+            f"{chunker_class().name:<12}{len(content):>12}{eager:>12.3f}{lazy:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(run_chunking_benchmark())
@@ -0,0 +1,81 @@
+import time
+
+from spacy.tokens import Doc
+
+from goldenverba.components.chunking.TokenChunker import (
+    get_chunk_offsets,
+    get_token_offsets,
+)
+from goldenverba.components.document import load_nlp_for_language
+
+# Compares the previous Span based TokenChunker loop against the offset fast path
+# on a 1M token document and checks that both produce the same chunk boundaries.
+
+TOKENS = 1000000
+
+SETTINGS = [(100, 0), (250, 50), (500, 100), (1000, 200)]
+
+WORDS = ["Verba", "splits", "documents", "into", "chunks", "before", "embedding", "."]
+
+
+def create_doc() -> Doc:
+    words = [WORDS[i % len(WORDS)] for i in range(TOKENS)]
+    spaces = [words[i + 1] != "." for i in range(TOKENS - 1)] + [False]
+    return Doc(load_nlp_for_language("en").vocab, words=words, spaces=spaces)
+
+
+def span_chunk_offsets(
+    doc: Doc, units: int, overlap: int
+) -> list[tuple[int, int, int]]:
+    """Previous implementation, builds two Spans per chunk"""
+    offsets = []
+    i = 0
+    while i < len(doc):
+        start_i = i
+        end_i = min(i + units + overlap, len(doc))
+        if end_i == len(doc):
+            overlap_start = end_i
+        else:
+            overlap_start = min(i + units, end_i)
+
+        offsets.append(
+            (
+                doc[start_i].idx,
+                doc[start_i:end_i].end_char,
+                doc[start_i:overlap_start].end_char,
+            )
+        )
+
+        if end_i == len(doc):
+            break
+        i += units
+    return offsets
+
+
+def fast_chunk_offsets(
+    doc: Doc, units: int, overlap: int
+) -> list[tuple[int, int, int]]:
+    token_starts, token_ends = get_token_offsets(doc)
+    return get_chunk_offsets(token_starts, token_ends, units, overlap)
+
+
+def run_token_benchmark():
+    doc = create_doc()
+    print(f"{'Tokens':>8}{'Overlap':>9}{'Chunks':>9}{'Span (s)':>11}{'Fast (s)':>11}")
+    for units, overlap in SETTINGS:
+        start_time = time.perf_counter()
+        expected = span_chunk_offsets(doc, units, overlap)
+        span_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        offsets = fast_chunk_offsets(doc, units, overlap)
+        fast_time = time.perf_counter() - start_time
+
+        assert offsets == expected, f"Boundaries differ for {units}/{overlap}"
+        print(
+            f"{units:>8}{overlap:>9}{len(offsets):>9}{span_time:>11.3f}{fast_time:>11.3f}"
+        )
+
+
+if __name__ == "__main__":
+    run_token_benchmark()
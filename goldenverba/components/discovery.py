@@ -0,0 +1,124 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Callable
+
+from wasabi import msg
+
+from goldenverba.components.util import get_cache_dir, get_token
+
+# Seconds until a discovered model list is refreshed
+MODEL_CACHE_TTL = int(get_token("VERBA_MODEL_CACHE_TTL", "3600"))
+# Seconds to wait before retrying a failed refresh
+MODEL_RETRY_INTERVAL = 60
+
+
+def cache_key(name: str, *parts: str | None) -> str:
+    """Create a file-safe cache key, secrets like API keys are only stored hashed"""
+    digest = hashlib.sha256(
+        "\x00".join(part or "" for part in parts).encode("utf-8")
+    ).hexdigest()
+    return f"{name}-{digest[:16]}"
+
+
+class ModelDiscovery:
+    """
+    Serves model lists of Embedders and Generators without blocking.
+    Lists are cached on disk so all workers of a deployment share them, stale lists are served while they are refreshed in a background thread.
+    """
+
+    def __init__(self, ttl: int = MODEL_CACHE_TTL):
+        self.ttl = ttl
+        self.cache_dir = None
+        self.entries: dict[str, dict] = {}
+        self.mtimes: dict[str, float] = {}
+        self.refreshing: set[str] = set()
+        self.failed: dict[str, float] = {}
+        self.lock = threading.Lock()
+
+    def get_path(self, key: str) -> str | None:
+        if self.cache_dir is None:
+            try:
+                self.cache_dir = get_cache_dir("models")
+            except OSError as e:
+                msg.warn(f"Model cache directory not available: {str(e)}")
+                return None
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get_models(
+        self, key: str, fetch: Callable[[], list[str]], default: list[str]
+    ) -> list[str]:
+        """Return the cached models for key (or default) and refresh them in the background if stale"""
+        entry = self.read(key)
+        if entry is None or time.time() - entry["timestamp"] > self.ttl:
+            self.schedule_refresh(key, fetch)
+        if entry is None:
+            return default
+        return entry["models"]
+
+    def read(self, key: str) -> dict | None:
+        """Read an entry from memory, reloading it when another worker updated the file"""
+        path = self.get_path(key)
+        if path is None:
+            return self.entries.get(key)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return self.entries.get(key)
+
+        if self.mtimes.get(key) != mtime:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.entries[key] = json.load(f)
+                self.mtimes[key] = mtime
+            except (OSError, ValueError) as e:
+                msg.warn(f"Couldn't read model cache {path}: {str(e)}")
+        return self.entries.get(key)
+
+    def write(self, key: str, models: list[str]):
+        entry = {"models": models, "timestamp": time.time()}
+        self.entries[key] = entry
+        path = self.get_path(key)
+        if path is None:
+            return
+        try:
+            # Write to a temporary file first so other workers never read partial files
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+            self.mtimes[key] = os.stat(path).st_mtime
+        except OSError as e:
+            msg.warn(f"Couldn't write model cache {path}: {str(e)}")
+
+    def schedule_refresh(self, key: str, fetch: Callable[[], list[str]]):
+        with self.lock:
+            if key in self.refreshing:
+                return
+            if time.time() - self.failed.get(key, 0) < MODEL_RETRY_INTERVAL:
+                return
+            self.refreshing.add(key)
+
+        thread = threading.Thread(
+            target=self.refresh, args=(key, fetch), name=f"verba-models-{key}"
+        )
+        thread.daemon = True
+        thread.start()
+
+    def refresh(self, key: str, fetch: Callable[[], list[str]]):
+        try:
+            models = fetch()
+            self.write(key, models)
+            self.failed.pop(key, None)
+        except Exception as e:
+            msg.info(f"Couldn't refresh models for {key}: {str(e)}")
+            self.failed[key] = time.time()
+        finally:
+            with self.lock:
+                self.refreshing.discard(key)
+
+
+model_discovery = ModelDiscovery()
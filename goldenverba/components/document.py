@@ -1,11 +1,21 @@
 from goldenverba.server.types import FileConfig
-from goldenverba.components.chunk import Chunk
+from goldenverba.components.chunk import Chunk, ChunkVectors
 from spacy.tokens import Doc
 from spacy.language import Language
 import spacy
 import json
+import os
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 
-from langdetect import detect
+from langdetect import detect_langs, DetectorFactory
+from langdetect.lang_detect_exception import LangDetectException
+
+# Make language detection deterministic
+DetectorFactory.seed = 0
 
 SUPPORTED_LANGUAGES = {
     "en": "English",
@@ -16,15 +26,44 @@ SUPPORTED_LANGUAGES = {
     "nl": "Dutch",
 }
 
+# Maximum amount of characters parsed by spaCy at once
+MAX_BATCH_SIZE = 500000
+
+# Language detection only looks at a few evenly spaced samples of the content
+LANGUAGE_SAMPLES = 5
+LANGUAGE_SAMPLE_SIZE = 1000
+# Minimum average probability to accept a detected language
+LANGUAGE_THRESHOLD = 0.7
+# Amount of detected languages remembered by content hash
+LANGUAGE_CACHE_SIZE = 1024
+
+language_cache: OrderedDict[str, str] = OrderedDict()
+language_cache_lock = threading.Lock()
+
+# Batching of nlp.pipe when multiple documents are parsed at once
+SPACY_BATCH_SIZE = int(os.getenv("VERBA_SPACY_BATCH_SIZE", "64"))
+SPACY_N_PROCESS = int(os.getenv("VERBA_SPACY_N_PROCESS", "1"))
+
+# Scripts of mixed language content, CJK ideographs and punctuation are tokenized as Chinese,
+# Latin text (including accented characters) as English
+SCRIPT_PATTERN = re.compile(
+    r"(?P<zh>[\u3000-\u303f\u3400-\u4dbf\u4e00-\u9fff\uff00-\uffef]+)"
+    r"|(?P<en>[\x00-\u024f]+)"
+    r"|(?P<other>[^\x00-\u024f\u3000-\u303f\u3400-\u4dbf\u4e00-\u9fff\uff00-\uffef]+)"
+)
+SENTENCE_ENDINGS = (".", "!", "?", "\u3002", "\uff01", "\uff1f")
 
-def load_nlp_for_language(language: str):
-    """Load SpaCy models based on language"""
+
+@lru_cache(maxsize=None)
+def load_nlp_for_language(language: str) -> Language:
+    """Load SpaCy models based on language, every pipeline is only created once per process"""
+    if language == "zh-hant":
+        # spaCy has no zh-hant language class, Traditional Chinese uses the Chinese pipeline
+        return load_nlp_for_language("zh")
     if language == "en":
         nlp = spacy.blank("en")
     elif language == "zh":
         nlp = spacy.blank("zh")
-    elif language == "zh-hant":
-        nlp = spacy.blank("zh-hant")
     elif language == "fr":
         nlp = spacy.blank("fr")
     elif language == "de":
@@ -42,68 +81,165 @@ def load_nlp_for_language(language: str):
     return nlp
 
 
+def sample_text(text: str, samples: int, sample_size: int) -> list[str]:
+    """Return evenly spaced samples from across the text"""
+    if len(text) <= samples * sample_size or samples < 2:
+        return [text[: samples * sample_size]]
+    step = (len(text) - sample_size) // (samples - 1)
+    return [text[i * step : i * step + sample_size] for i in range(samples)]
+
+
 def detect_language(text: str) -> str:
-    """Automatically detect language"""
-    try:
-        detected_lang = detect(text)
-        if detected_lang == "zh-cn":
-            return "zh"
-        elif detected_lang == "zh-tw" or detected_lang == "zh-hk":
-            return "zh-hant"
-        return detected_lang
-    except:
+    """Automatically detect language, results are memoized by the hash of the text"""
+    key = hashlib.sha1(text.encode("utf-8", "surrogatepass")).hexdigest()
+    with language_cache_lock:
+        if key in language_cache:
+            language_cache.move_to_end(key)
+            return language_cache[key]
+
+    detected_lang = detect_language_from_samples(text)
+
+    with language_cache_lock:
+        language_cache[key] = detected_lang
+        if len(language_cache) > LANGUAGE_CACHE_SIZE:
+            language_cache.popitem(last=False)
+    return detected_lang
+
+
+def detect_language_from_samples(text: str) -> str:
+    """Average the language probabilities over samples of the text, returns unknown below the threshold"""
+    samples = sample_text(text, LANGUAGE_SAMPLES, LANGUAGE_SAMPLE_SIZE)
+    scores: dict[str, float] = {}
+    for sample in samples:
+        try:
+            for language in detect_langs(sample):
+                scores[language.lang] = scores.get(language.lang, 0) + language.prob
+        except LangDetectException:
+            continue
+
+    if not scores:
         return "unknown"
 
+    detected_lang = max(scores, key=scores.get)
+    if scores[detected_lang] / len(samples) < LANGUAGE_THRESHOLD:
+        return "unknown"
 
-def split_text_by_language(text: str):
-    """Separate text into language parts based on character ranges"""
-    chinese_simplified = "".join(
-        [char for char in text if "\u4e00" <= char <= "\u9fff"]
-    )
-    chinese_traditional = "".join(
-        [
-            char
-            for char in text
-            if "\u3400" <= char <= "\u4dbf" or "\u4e00" <= char <= "\u9fff"
-        ]
-    )
-    english_part = "".join([char for char in text if char.isascii()])
-    other_text = "".join(
-        [char for char in text if not (char.isascii() or "\u4e00" <= char <= "\u9fff")]
-    )
+    if detected_lang == "zh-cn":
+        return "zh"
+    elif detected_lang == "zh-tw" or detected_lang == "zh-hk":
+        return "zh-hant"
+    return detected_lang
 
-    return chinese_simplified, chinese_traditional, english_part, other_text
 
+def split_text_by_language(text: str) -> list[tuple[str, int, str]]:
+    """Split text into runs of the same script in a single pass.
+    Returns (language, start, text) for every run in original order, runs cover the whole text.
+    """
+    return [
+        (match.lastgroup, match.start(), match.group())
+        for match in SCRIPT_PATTERN.finditer(text)
+    ]
 
-def process_mixed_language(content: str):
-    """Process mixed language text"""
-    chinese_simplified, chinese_traditional, english_text, other_text = (
-        split_text_by_language(content)
+
+def process_mixed_language(content: str) -> Doc:
+    """Process mixed language text, every script run is tokenized by the pipeline of its language.
+    The runs are merged in original order so token offsets (idx) match the content.
+    """
+    runs = split_text_by_language(content)
+
+    # Runs of other scripts share a single detected language, fall back to English tokenization
+    other_text = " ".join(text for language, _, text in runs if language == "other")
+    other_language = detect_language(other_text) if other_text else "en"
+    if other_language not in SUPPORTED_LANGUAGES:
+        other_language = "en"
+
+    runs_by_language: dict[str, list[int]] = {}
+    for i, (language, _, _) in enumerate(runs):
+        if language == "other":
+            language = other_language
+        runs_by_language.setdefault(language, []).append(i)
+
+    run_docs: list[Doc | None] = [None] * len(runs)
+    for language, indices in runs_by_language.items():
+        nlp = load_nlp_for_language(language)
+        for i, doc in zip(indices, nlp.pipe(runs[i][2] for i in indices)):
+            run_docs[i] = doc
+
+    # Pipelines of different languages don't share a Vocab, so the tokens are copied into one Doc
+    words, spaces, sent_starts = [], [], []
+    previous_text = ""
+    for doc in run_docs:
+        for token in doc:
+            if token.i == 0 and words:
+                # A run only starts a sentence if the previous run ended one
+                sent_starts.append(previous_text.endswith(SENTENCE_ENDINGS))
+            else:
+                sent_starts.append(bool(token.is_sent_start))
+            words.append(token.text)
+            spaces.append(bool(token.whitespace_))
+            if not token.is_space:
+                previous_text = token.text
+
+    return Doc(
+        load_nlp_for_language("en").vocab,
+        words=words,
+        spaces=spaces,
+        sent_starts=sent_starts or None,
     )
 
-    docs = []
 
-    if chinese_simplified:
-        nlp_zh = load_nlp_for_language("zh")
-        docs.append(nlp_zh(chinese_simplified))
+def parse_content(content: str) -> Doc:
+    """Detect the language of the content and parse it into a spaCy Doc"""
+    if len(content) > MAX_BATCH_SIZE:
+        # Process content in batches
+        docs = []
+        detected_language = detect_language(content)
+        if detected_language in SUPPORTED_LANGUAGES:
+            nlp = load_nlp_for_language(detected_language)
+        else:
+            nlp = process_mixed_language
 
-    if chinese_traditional:
-        nlp_zh_hant = load_nlp_for_language("zh-hant")
-        docs.append(nlp_zh_hant(chinese_traditional))
+        for i in range(0, len(content), MAX_BATCH_SIZE):
+            docs.append(nlp(content[i : i + MAX_BATCH_SIZE]))
+
+        # Merged all processed docs, without added whitespace so offsets match the content
+        return Doc.from_docs(docs, ensure_whitespace=False)
+    else:
+        # Process smaller content, directly based on language
+        detected_language = detect_language(content)
+        if detected_language in SUPPORTED_LANGUAGES:
+            nlp = load_nlp_for_language(detected_language)
+            return nlp(content)
+        else:
+            # Process mixed language content
+            return process_mixed_language(content)
 
-    if english_text:
-        nlp_en = load_nlp_for_language("en")
-        docs.append(nlp_en(english_text))
 
-    if other_text:
-        detected_lang = detect_language(other_text)
-        if detected_lang in SUPPORTED_LANGUAGES:
-            nlp_other = load_nlp_for_language(detected_lang)
-            docs.append(nlp_other(other_text))
+def parse_documents(
+    documents: list["Document"],
+    batch_size: int = SPACY_BATCH_SIZE,
+    n_process: int = SPACY_N_PROCESS,
+):
+    """Parse multiple documents at once, documents of the same language are parsed in a single nlp.pipe batch.
+    Large and mixed language documents are left to be parsed on first access of spacy_doc.
+    """
+    batches: dict[str, list[Document]] = {}
+    for document in documents:
+        if document._spacy_doc is not None or len(document.content) > MAX_BATCH_SIZE:
+            continue
+        detected_language = detect_language(document.content)
+        if detected_language in SUPPORTED_LANGUAGES:
+            batches.setdefault(detected_language, []).append(document)
 
-    # Merge all processed documents
-    doc = Doc.from_docs(docs)
-    return doc
+    for language, batch in batches.items():
+        nlp = load_nlp_for_language(language)
+        docs = nlp.pipe(
+            (document.content for document in batch),
+            batch_size=batch_size,
+            n_process=n_process,
+        )
+        for document, doc in zip(batch, docs):
+            document.spacy_doc = doc
 
 
 class Document:
@@ -127,35 +263,22 @@ class Document:
         self.meta = meta
         self.metadata = metadata
         self.chunks: list[Chunk] = []
+        # Vectors created while chunking by chunk_id, these chunks are not embedded again
+        self.chunk_vectors: dict[int, list[float]] = {}
+        # Vectors of all chunks after embedding
+        self.vectors: ChunkVectors | None = None
+        self._spacy_doc: Doc | None = None
 
-        MAX_BATCH_SIZE = 500000
-
-        if len(content) > MAX_BATCH_SIZE:
-            # Process content in batches
-            print("TOOO BIG!")
-            docs = []
-            detected_language = detect_language(content[0:MAX_BATCH_SIZE])
-            if detected_language in SUPPORTED_LANGUAGES:
-                nlp = load_nlp_for_language(detected_language)
-            else:
-                nlp = process_mixed_language
-
-            for i in range(0, len(content), MAX_BATCH_SIZE):
-                docs.append(nlp(content[i : i + MAX_BATCH_SIZE]))
-
-            # Merged all processed docs
-            doc = Doc.from_docs(docs)
-        else:
-            # Process smaller content, directly based on language
-            detected_language = detect_language(content)
-            if detected_language in SUPPORTED_LANGUAGES:
-                nlp = load_nlp_for_language(detected_language)
-                doc = nlp(content)
-            else:
-                # Process mixed language content
-                doc = process_mixed_language(content)
+    @property
+    def spacy_doc(self) -> Doc:
+        """spaCy Doc of the content, only parsed when a chunker requires it"""
+        if self._spacy_doc is None:
+            self._spacy_doc = parse_content(self.content)
+        return self._spacy_doc
 
-        self.spacy_doc = doc
+    @spacy_doc.setter
+    def spacy_doc(self, doc: Doc | None):
+        self._spacy_doc = doc
 
     @staticmethod
     def to_json(document) -> dict:
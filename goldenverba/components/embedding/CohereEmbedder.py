@@ -1,14 +1,22 @@
 import os
 import requests
-import aiohttp
 import json
 
 from goldenverba.components.interfaces import Embedding
+from goldenverba.components.discovery import cache_key
 from goldenverba.components.types import InputConfig
 from goldenverba.components.util import get_environment, get_token
+from goldenverba.components.sessions import http_sessions
 
 from wasabi import msg
 
+DEFAULT_MODELS = [
+    "embed-english-v3.0",
+    "embed-multilingual-v3.0",
+    "embed-english-light-v3.0",
+    "embed-multilingual-light-v3.0",
+]
+
 
 class CohereEmbedder(Embedding):
     """
@@ -19,8 +27,18 @@ class CohereEmbedder(Embedding):
         super().__init__()
         self.name = "Cohere"
         self.description = "Vectorizes documents and queries using Cohere"
+        # Cohere accepts 96 texts per request
+        self.max_batch_size = 96
         self.url = os.getenv("COHERE_BASE_URL", "https://api.cohere.com/v1")
-        models = get_models(self.url, get_token("COHERE_API_KEY", None), "embed")
+        token = get_token("COHERE_API_KEY", None)
+        if token is None:
+            models = DEFAULT_MODELS
+        else:
+            models = self.discover_models(
+                cache_key("cohere-embed", self.url, token),
+                lambda: get_models(self.url, token, "embed"),
+                DEFAULT_MODELS,
+            )
 
         self.config["Model"] = InputConfig(
             type="dropdown",
@@ -55,7 +73,7 @@ class CohereEmbedder(Embedding):
 
         all_embeddings = []
 
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             for chunk in chunks(content, 96):
                 data = {"texts": chunk, "model": model, "input_type": "search_document"}
                 async with session.post(
@@ -69,29 +87,14 @@ class CohereEmbedder(Embedding):
         return all_embeddings
 
 
-def get_models(url: str, token: str, model_type: str):
-    try:
-        if token is None or token == "":
-            return [
-                "embed-english-v3.0",
-                "embed-multilingual-v3.0",
-                "embed-english-light-v3.0",
-                "embed-multilingual-light-v3.0",
-            ]
-        headers = {"Authorization": f"bearer {token}"}
-        response = requests.get(url + "/models", headers=headers)
-        data = response.json()
-        if "models" in data:
-            return [
-                model["name"]
-                for model in data["models"]
-                if model_type in model["endpoints"]
-            ]
-    except Exception as e:
-        msg.warn(f"Couldn't fetch models from Cohere endpoint: {e}")
-        return [
-            "embed-english-v3.0",
-            "embed-multilingual-v3.0",
-            "embed-english-light-v3.0",
-            "embed-multilingual-light-v3.0",
-        ]
+def get_models(url: str, token: str, model_type: str) -> list[str]:
+    """Fetch models supporting model_type from Cohere, raises if Cohere can't be reached"""
+    headers = {"Authorization": f"bearer {token}"}
+    response = requests.get(url + "/models", headers=headers, timeout=10)
+    response.raise_for_status()
+    data = response.json()
+    return [
+        model["name"]
+        for model in data.get("models", [])
+        if model_type in model["endpoints"]
+    ]
@@ -0,0 +1,70 @@
+import os
+
+import numpy as np
+
+from goldenverba.components.interfaces import Embedding
+from goldenverba.components.types import InputConfig
+from goldenverba.components.sessions import http_sessions
+from goldenverba.components.embedding.SentenceTransformersEmbedder import (
+    DEFAULT_MODELS,
+)
+
+
+class EmbeddingServerEmbedder(Embedding):
+    """
+    EmbeddingServerEmbedder for Verba, sends texts to the local embedding server that all workers share.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.name = "Embedding Server"
+        self.requires_env = ["VERBA_EMBEDDING_SERVER_URL"]
+        self.description = "Embeds and retrieves objects using SentenceTransformers models of the local embedding server (verba start --embedding-server)"
+        self.config = {
+            "Model": InputConfig(
+                type="dropdown",
+                value="all-MiniLM-L6-v2",
+                description="Select an HuggingFace Embedding Model",
+                values=DEFAULT_MODELS,
+            ),
+            "Batch Size": InputConfig(
+                type="number",
+                value=32,
+                description="Amount of texts the model encodes at once",
+                values=[],
+            ),
+            "Normalize Embeddings": InputConfig(
+                type="bool",
+                value=False,
+                description="Scale embeddings to unit length",
+                values=[],
+            ),
+        }
+
+    async def vectorize(self, config: dict, content: list[str]) -> list[float]:
+        url = os.getenv("VERBA_EMBEDDING_SERVER_URL")
+        if url is None:
+            raise Exception("No embedding server found (VERBA_EMBEDDING_SERVER_URL)")
+
+        payload = {
+            "model": config.get("Model").value,
+            "texts": content,
+            "batch_size": int(config["Batch Size"].value),
+            "normalize": bool(config["Normalize Embeddings"].value),
+        }
+
+        try:
+            async with http_sessions.session() as session:
+                async with session.post(
+                    url.rstrip("/") + "/embed", json=payload
+                ) as response:
+                    response.raise_for_status()
+                    dimensions = int(response.headers["X-Embedding-Dimensions"])
+                    data = await response.read()
+        except Exception as e:
+            raise Exception(f"Failed to vectorize chunks: {str(e)}")
+
+        if dimensions == 0:
+            return []
+        # The server answers with a float32 matrix, rows are used without conversion
+        return list(np.frombuffer(data, dtype=np.float32).reshape(-1, dimensions))
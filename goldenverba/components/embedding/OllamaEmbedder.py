@@ -1,12 +1,13 @@
 import os
 import requests
 from wasabi import msg
-import aiohttp
 from urllib.parse import urljoin
 
 from goldenverba.components.interfaces import Embedding
+from goldenverba.components.discovery import cache_key
 from goldenverba.components.types import InputConfig
 from goldenverba.components.util import get_environment
+from goldenverba.components.sessions import http_sessions
 
 
 class OllamaEmbedder(Embedding):
@@ -16,7 +17,11 @@ class OllamaEmbedder(Embedding):
         self.name = "Ollama"
         self.url = os.getenv("OLLAMA_URL", "http://localhost:11434")
         self.description = f"Vectorizes documents and queries using Ollama. If your Ollama instance is not running on {self.url}, you can change the URL by setting the OLLAMA_URL environment variable."
-        models = get_models(self.url)
+        models = self.discover_models(
+            cache_key("ollama", self.url),
+            lambda: get_models(self.url),
+            [f"Couldn't connect to Ollama {self.url}"],
+        )
 
         self.config = {
             "Model": InputConfig(
@@ -33,7 +38,7 @@ class OllamaEmbedder(Embedding):
 
         data = {"model": model, "input": content}
 
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             async with session.post(urljoin(self.url, "/api/embed"), json=data) as response:
                 response.raise_for_status()
                 data = await response.json()
@@ -41,15 +46,13 @@ class OllamaEmbedder(Embedding):
                 return embeddings
 
 
-def get_models(url: str):
-    try:
-        response = requests.get(urljoin(url, "/api/tags"))
-        models = [model.get("name") for model in response.json().get("models")]
-        if len(models) > 0:
-            return models
-        else:
-            msg.info("No Ollama Model detected")
-            return ["No Ollama Model detected"]
-    except Exception as e:
-        msg.info(f"Couldn't connect to Ollama {url}")
-        return [f"Couldn't connect to Ollama {url}"]
+def get_models(url: str) -> list[str]:
+    """Fetch installed models from Ollama, raises if Ollama can't be reached"""
+    response = requests.get(urljoin(url, "/api/tags"), timeout=10)
+    response.raise_for_status()
+    models = [model.get("name") for model in response.json().get("models")]
+    if len(models) > 0:
+        return models
+    else:
+        msg.info("No Ollama Model detected")
+        return ["No Ollama Model detected"]
@@ -7,8 +7,16 @@ import aiohttp
 from wasabi import msg
 
 from goldenverba.components.interfaces import Embedding
+from goldenverba.components.discovery import cache_key
 from goldenverba.components.types import InputConfig
 from goldenverba.components.util import get_environment, get_token
+from goldenverba.components.sessions import http_sessions
+
+DEFAULT_MODELS = [
+    "text-embedding-ada-002",
+    "text-embedding-3-small",
+    "text-embedding-3-large",
+]
 
 
 class OpenAIEmbedder(Embedding):
@@ -18,11 +26,21 @@ class OpenAIEmbedder(Embedding):
         super().__init__()
         self.name = "OpenAI"
         self.description = "Vectorizes documents and queries using OpenAI"
+        # OpenAI accepts 2048 inputs and 300k tokens per request
+        self.max_batch_size = 2048
+        self.max_batch_tokens = 250000
 
         # Fetch available models
         api_key = get_token("OPENAI_API_KEY")
         base_url = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
-        models = self.get_models(api_key, base_url)
+        if api_key is None:
+            models = DEFAULT_MODELS
+        else:
+            models = self.discover_models(
+                cache_key("openai-embedding", base_url, api_key),
+                lambda: self.get_models(api_key, base_url),
+                DEFAULT_MODELS,
+            )
 
         # Set up configuration
         self.config = {
@@ -70,7 +88,7 @@ class OpenAIEmbedder(Embedding):
         payload_bytes = json.dumps(payload).encode("utf-8")
         payload_io = io.BytesIO(payload_bytes)
 
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             try:
                 async with session.post(
                     f"{base_url}/embeddings",
@@ -103,29 +121,14 @@ class OpenAIEmbedder(Embedding):
 
     @staticmethod
     def get_models(token: str, url: str) -> List[str]:
-        """Fetch available embedding models from OpenAI API."""
-        try:
-            if token is None:
-                return [
-                    "text-embedding-ada-002",
-                    "text-embedding-3-small",
-                    "text-embedding-3-large",
-                ]
-
-            import requests  # Import here to avoid dependency if not needed
-
-            headers = {"Authorization": f"Bearer {token}"}
-            response = requests.get(f"{url}/models", headers=headers)
-            response.raise_for_status()
-            return [
-                model["id"]
-                for model in response.json()["data"]
-                if "embedding" in model["id"]
-            ]
-        except Exception as e:
-            msg.info(f"Failed to fetch OpenAI embedding models: {str(e)}")
-            return [
-                "text-embedding-ada-002",
-                "text-embedding-3-small",
-                "text-embedding-3-large",
-            ]
+        """Fetch available embedding models from OpenAI API, raises on failure."""
+        import requests  # Import here to avoid dependency if not needed
+
+        headers = {"Authorization": f"Bearer {token}"}
+        response = requests.get(f"{url}/models", headers=headers, timeout=10)
+        response.raise_for_status()
+        return [
+            model["id"]
+            for model in response.json()["data"]
+            if "embedding" in model["id"]
+        ]
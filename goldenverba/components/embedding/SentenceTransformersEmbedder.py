@@ -1,10 +1,16 @@
 from goldenverba.components.interfaces import Embedding
 from goldenverba.components.types import InputConfig
+from goldenverba.components.executor import offload_executor
+from goldenverba.components.model_pool import model_pool
 
-try:
-    from sentence_transformers import SentenceTransformer
-except Exception as e:
-    pass
+DEFAULT_MODELS = [
+    "all-MiniLM-L6-v2",
+    "mixedbread-ai/mxbai-embed-large-v1",
+    "all-mpnet-base-v2",
+    "BAAI/bge-m3",
+    "all-MiniLM-L12-v2",
+    "paraphrase-MiniLM-L6-v2",
+]
 
 
 class SentenceTransformersEmbedder(Embedding):
@@ -22,22 +28,37 @@ class SentenceTransformersEmbedder(Embedding):
                 type="dropdown",
                 value="all-MiniLM-L6-v2",
                 description="Select an HuggingFace Embedding Model",
-                values=[
-                    "all-MiniLM-L6-v2",
-                    "mixedbread-ai/mxbai-embed-large-v1",
-                    "all-mpnet-base-v2",
-                    "BAAI/bge-m3",
-                    "all-MiniLM-L12-v2",
-                    "paraphrase-MiniLM-L6-v2",
-                ],
+                values=DEFAULT_MODELS,
+            ),
+            "Batch Size": InputConfig(
+                type="number",
+                value=32,
+                description="Amount of texts the model encodes at once",
+                values=[],
+            ),
+            "Normalize Embeddings": InputConfig(
+                type="bool",
+                value=False,
+                description="Scale embeddings to unit length",
+                values=[],
             ),
         }
 
     async def vectorize(self, config: dict, content: list[str]) -> list[float]:
         try:
             model_name = config.get("Model").value
-            model = SentenceTransformer(model_name)
-            embeddings = model.encode(content).tolist()
-            return embeddings
+            # Older configs don't contain the encoding settings yet
+            batch_size = config["Batch Size"].value if "Batch Size" in config else 32
+            normalize = (
+                config["Normalize Embeddings"].value
+                if "Normalize Embeddings" in config
+                else False
+            )
+            # The model stays loaded in this process, so encoding runs in a thread
+            embeddings = await offload_executor.run(
+                model_pool.encode, model_name, content, int(batch_size), bool(normalize)
+            )
+            # Rows of the float32 matrix, no Python float per dimension
+            return list(embeddings)
         except Exception as e:
             raise Exception(f"Failed to vectorize chunks: {str(e)}")
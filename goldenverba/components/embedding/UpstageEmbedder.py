@@ -9,6 +9,7 @@ from wasabi import msg
 from goldenverba.components.interfaces import Embedding
 from goldenverba.components.types import InputConfig
 from goldenverba.components.util import get_environment, get_token
+from goldenverba.components.sessions import http_sessions
 
 
 class UpstageEmbedder(Embedding):
@@ -72,7 +73,7 @@ class UpstageEmbedder(Embedding):
         payload_bytes = json.dumps(payload).encode("utf-8")
         payload_io = io.BytesIO(payload_bytes)
 
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             try:
                 async with session.post(
                     f"{base_url}/embeddings",
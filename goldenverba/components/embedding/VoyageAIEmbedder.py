@@ -9,6 +9,7 @@ from wasabi import msg
 from goldenverba.components.interfaces import Embedding
 from goldenverba.components.types import InputConfig
 from goldenverba.components.util import get_environment
+from goldenverba.components.sessions import http_sessions
 
 
 class VoyageAIEmbedder(Embedding):
@@ -18,6 +19,8 @@ class VoyageAIEmbedder(Embedding):
         super().__init__()
         self.name = "VoyageAI"
         self.description = "Vectorizes documents and queries using VoyageAI"
+        # Smallest token limit per request of the Voyage models, counted with a different tokenizer
+        self.max_batch_tokens = 100000
 
         # Fetch available models
         api_key = os.getenv("VOYAGE_API_KEY")
@@ -66,7 +69,7 @@ class VoyageAIEmbedder(Embedding):
         }
         payload = {"input": content, "model": model}
 
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             try:
                 async with session.post(
                     f"{base_url}/embeddings",
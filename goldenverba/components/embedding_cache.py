@@ -0,0 +1,210 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+from wasabi import msg
+
+from goldenverba.components.util import get_cache_dir, get_token
+
+# Maximum amount of cached embeddings, least recently used ones are evicted (0 disables the cache)
+EMBEDDING_CACHE_SIZE = int(get_token("VERBA_EMBEDDING_CACHE_SIZE", "100000"))
+# Query vectors kept in memory per worker (0 disables) and seconds until they expire
+QUERY_CACHE_SIZE = int(get_token("VERBA_QUERY_CACHE_SIZE", "1024"))
+QUERY_CACHE_TTL = int(get_token("VERBA_QUERY_CACHE_TTL", "3600"))
+
+
+def get_cache_settings(config: dict) -> str:
+    """Settings of an Embedder config that change its vectors (all but credentials), part of both cache keys"""
+    return "\x00".join(
+        f"{name}={setting.value}"
+        for name, setting in sorted(config.items())
+        if setting.type != "password"
+    )
+
+
+def embedding_key(embedder: str, settings: str, text: str) -> bytes:
+    return hashlib.sha256(
+        "\x00".join([embedder, settings, text]).encode("utf-8")
+    ).digest()
+
+
+class EmbeddingCache:
+    """
+    Persistent cache of embeddings keyed by embedder, settings (model, normalization, ...) and text hash.
+    Vectors are stored as float32 in SQLite in the Verba cache directory, so all workers and restarts share them.
+    """
+
+    def __init__(self, max_entries: int = EMBEDDING_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.connection: sqlite3.Connection | None = None
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get_connection(self) -> sqlite3.Connection:
+        if self.connection is None:
+            path = os.path.join(get_cache_dir("embeddings"), "embeddings.sqlite")
+            connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)"
+            )
+            connection.commit()
+            self.connection = connection
+        return self.connection
+
+    def get_many(
+        self, embedder: str, settings: str, texts: list[str]
+    ) -> list[np.ndarray | None]:
+        """Return the cached vector of every text or None, blocking, run it in the offload executor"""
+        if not self.enabled or not texts:
+            return [None] * len(texts)
+        keys = [embedding_key(embedder, settings, text) for text in texts]
+        vectors = {}
+        try:
+            with self.lock:
+                connection = self.get_connection()
+                # SQLite limits the amount of variables per statement
+                for i in range(0, len(keys), 500):
+                    batch = keys[i : i + 500]
+                    rows = connection.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})",
+                        batch,
+                    ).fetchall()
+                    vectors.update(rows)
+                if vectors:
+                    now = time.time()
+                    connection.executemany(
+                        "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                        [(now, key) for key in vectors],
+                    )
+                    connection.commit()
+        except sqlite3.Error as e:
+            msg.warn(f"Embedding cache not available: {str(e)}")
+            return [None] * len(texts)
+
+        self.hits += len(vectors)
+        self.misses += len(keys) - len(vectors)
+        return [
+            np.frombuffer(vectors[key], dtype=np.float32) if key in vectors else None
+            for key in keys
+        ]
+
+    def put_many(
+        self, embedder: str, settings: str, texts: list[str], vectors: list[list[float]]
+    ):
+        """Store vectors and evict the least recently used ones above max_entries, blocking"""
+        if not self.enabled or not texts:
+            return
+        now = time.time()
+        rows = [
+            (
+                embedding_key(embedder, settings, text),
+                np.asarray(vector, dtype=np.float32).tobytes(),
+                now,
+            )
+            for text, vector in zip(texts, vectors)
+        ]
+        try:
+            with self.lock:
+                connection = self.get_connection()
+                connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+                    rows,
+                )
+                count = connection.execute(
+                    "SELECT COUNT(*) FROM embeddings"
+                ).fetchone()[0]
+                if count > self.max_entries:
+                    connection.execute(
+                        "DELETE FROM embeddings WHERE key IN (SELECT key FROM embeddings ORDER BY last_used LIMIT ?)",
+                        (count - self.max_entries,),
+                    )
+                connection.commit()
+        except sqlite3.Error as e:
+            msg.warn(f"Couldn't write embedding cache: {str(e)}")
+
+    def get_report(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def close(self):
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+
+class QueryVectorCache:
+    """
+    In-memory LRU cache of query vectors with a time to live.
+    Keys are the Embedder, its settings without credentials and the query with normalized whitespace.
+    """
+
+    def __init__(self, max_entries: int = QUERY_CACHE_SIZE, ttl: int = QUERY_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries: OrderedDict[tuple, tuple[float, list[float]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get_key(self, embedder: str, config: dict, query: str) -> tuple:
+        return (
+            embedder,
+            get_cache_settings(config),
+            re.sub(r"\s+", " ", query).strip(),
+        )
+
+    def get(self, key: tuple) -> list[float] | None:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] <= self.ttl:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: tuple, vector: list[float]):
+        if self.max_entries <= 0:
+            return
+        with self.lock:
+            self.entries[key] = (time.monotonic(), vector)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def get_report(self) -> dict:
+        with self.lock:
+            requests = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / requests, 4) if requests else None,
+            }
+
+
+embedding_cache = EmbeddingCache()
+query_cache = QueryVectorCache()
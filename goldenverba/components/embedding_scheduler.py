@@ -0,0 +1,244 @@
+import asyncio
+import random
+from typing import Awaitable, Callable
+
+import aiohttp
+from wasabi import msg
+
+from goldenverba.components.util import get_token
+
+# Requests per second every Embedder may send (0 for no limit)
+EMBEDDING_RATE_LIMIT = float(get_token("VERBA_EMBEDDING_RATE_LIMIT", "0"))
+# Retries of a batch after rate limits, server errors and timeouts
+EMBEDDING_RETRIES = int(get_token("VERBA_EMBEDDING_RETRIES", "5"))
+# Seconds to wait before the first retry, doubled on every further retry
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 60.0
+# Successful batches after which a batch size reduced by a rejected batch is doubled again
+BATCH_SIZE_RECOVERY = 20
+
+# Error messages of providers rejecting a request because it is too large
+OVERSIZE_MESSAGES = [
+    "too large",
+    "too long",
+    "maximum context length",
+    "max allowed",
+    "tokens per request",
+    "too many tokens",
+    "token limit",
+    "input length",
+    "batch size",
+]
+
+
+def get_status(error: BaseException) -> int | None:
+    status = getattr(error, "status", None) or getattr(error, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def get_causes(error: BaseException) -> list[BaseException]:
+    """Embedders often wrap errors, return the error and everything it was raised from"""
+    causes = []
+    while error is not None and error not in causes:
+        causes.append(error)
+        error = error.__cause__ or error.__context__
+    return causes
+
+
+def is_oversize_message(causes: list[BaseException]) -> bool:
+    return any(
+        message in str(cause).lower()
+        for cause in causes
+        for message in OVERSIZE_MESSAGES
+    )
+
+
+def classify_error(error: Exception) -> tuple[str, float | None]:
+    """Return whether a failed request hit a rate limit ("rate_limit"), should be retried ("retry"),
+    split ("oversize") or not ("fatal"), and the delay requested by the provider.
+    A 400 only counts as oversize if its message mentions the input size, other bad requests fail right away.
+    """
+    causes = get_causes(error)
+    for cause in causes:
+        status = get_status(cause)
+        if status == 429:
+            return "rate_limit", get_retry_after(cause)
+        if status is not None and status >= 500:
+            return "retry", get_retry_after(cause)
+        if status == 413:
+            return "oversize", None
+        if status == 400:
+            return ("oversize" if is_oversize_message(causes) else "fatal"), None
+        if status is not None:
+            return "fatal", None
+        if isinstance(cause, (asyncio.TimeoutError, aiohttp.ClientConnectionError)):
+            return "retry", None
+    if is_oversize_message(causes):
+        return "oversize", None
+    return "fatal", None
+
+
+def get_retry_after(error: BaseException) -> float | None:
+    headers = getattr(error, "headers", None)
+    if not headers or "Retry-After" not in headers:
+        return None
+    try:
+        return float(headers["Retry-After"])
+    except ValueError:
+        return None
+
+
+def pack_batches(
+    content: list[str],
+    max_batch_size: int,
+    max_batch_tokens: int | None = None,
+    token_counts: list[int] | None = None,
+) -> list[list[str]]:
+    """Split content into consecutive batches of at most max_batch_size texts and max_batch_tokens tokens.
+    Texts above max_batch_tokens are sent alone.
+    """
+    if max_batch_tokens is None or token_counts is None:
+        return [
+            content[i : i + max_batch_size]
+            for i in range(0, len(content), max_batch_size)
+        ]
+
+    batches = []
+    start = 0
+    batch_tokens = 0
+    for i, tokens in enumerate(token_counts):
+        if i > start and (
+            i - start >= max_batch_size or batch_tokens + tokens > max_batch_tokens
+        ):
+            batches.append(content[start:i])
+            start = i
+            batch_tokens = 0
+        batch_tokens += tokens
+    if start < len(content):
+        batches.append(content[start:])
+    return batches
+
+
+class TokenBucket:
+    """Allows rate requests per second on average and bursts of up to rate requests"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated: float | None = None
+        # Set after rate limit responses, no request is sent before
+        self.paused_until = 0.0
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                if self.rate <= 0:
+                    return
+                if self.updated is not None:
+                    self.tokens = min(
+                        self.capacity, self.tokens + (now - self.updated) * self.rate
+                    )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, delay: float):
+        loop = asyncio.get_running_loop()
+        self.paused_until = max(self.paused_until, loop.time() + delay)
+
+
+class EmbeddingScheduler:
+    """
+    Schedules the batch requests of one Embedder across all imports:
+    limits concurrent requests and requests per second, retries rate limited and failed batches with jittered backoff
+    and splits batches the provider rejects as too large. Later batches use the smaller size,
+    which is doubled again after BATCH_SIZE_RECOVERY successful batches.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        requests_per_second: float = EMBEDDING_RATE_LIMIT,
+        max_retries: int = EMBEDDING_RETRIES,
+    ):
+        self.name = name
+        self.semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self.bucket = TokenBucket(requests_per_second)
+        self.max_retries = max_retries
+        self.batch_size_limit: int | None = None
+        self.successful_batches = 0
+
+    def get_batch_size(self, max_batch_size: int) -> int:
+        if (
+            self.batch_size_limit is not None
+            and self.batch_size_limit >= max_batch_size
+        ):
+            self.batch_size_limit = None
+        if self.batch_size_limit is None:
+            return max_batch_size
+        return self.batch_size_limit
+
+    def record_success(self):
+        """Relax a reduced batch size once enough batches went through"""
+        if self.batch_size_limit is None:
+            return
+        self.successful_batches += 1
+        if self.successful_batches >= BATCH_SIZE_RECOVERY:
+            self.batch_size_limit *= 2
+            self.successful_batches = 0
+
+    async def vectorize(
+        self,
+        vectorize: Callable[[list[str]], Awaitable[list[list[float]]]],
+        batch: list[str],
+    ) -> list[list[float]]:
+        """Embed one batch, splitting it if it is too large for the provider"""
+        for attempt in range(self.max_retries + 1):
+            await self.bucket.acquire()
+            async with self.semaphore:
+                try:
+                    vectors = await vectorize(batch)
+                    self.record_success()
+                    return vectors
+                except Exception as e:
+                    error = e
+
+            kind, retry_after = classify_error(error)
+            if kind == "oversize" and len(batch) > 1:
+                half = len(batch) // 2
+                self.batch_size_limit = min(self.batch_size_limit or half, half)
+                self.successful_batches = 0
+                msg.warn(
+                    f"{self.name} rejected a batch of {len(batch)}, splitting batches to {half}"
+                )
+                results = await asyncio.gather(
+                    self.vectorize(vectorize, batch[:half]),
+                    self.vectorize(vectorize, batch[half:]),
+                )
+                return results[0] + results[1]
+
+            if kind not in ["rate_limit", "retry"] or attempt == self.max_retries:
+                raise error
+
+            if retry_after is not None:
+                delay = retry_after * random.uniform(1.0, 1.2)
+            else:
+                delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt)
+                delay *= random.uniform(0.5, 1.5)
+            # Rate limits apply to the whole provider, all batches wait
+            if kind == "rate_limit":
+                self.bucket.pause(delay)
+            msg.warn(
+                f"{self.name} request failed ({str(error)}), retry {attempt + 1}/{self.max_retries} in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
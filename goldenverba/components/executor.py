@@ -0,0 +1,151 @@
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
+
+from wasabi import msg
+
+from goldenverba.components.util import get_token
+
+# Where picklable CPU heavy work runs ("thread" or "process"), other blocking work always runs in threads
+EXECUTOR_MODE = get_token("VERBA_EXECUTOR", "thread")
+EXECUTOR_WORKERS = int(
+    get_token("VERBA_EXECUTOR_WORKERS", str(min(8, os.cpu_count() or 1)))
+)
+
+# Seconds between two measurements of the event loop lag
+LOOP_LAG_INTERVAL = 0.1
+# Amount of measurements kept for the report
+LOOP_LAG_WINDOW = 600
+
+
+class OffloadExecutor:
+    """
+    Runs blocking and CPU heavy work (parsing, PCA, local models) outside of the event loop,
+    so websockets and queries are served while documents are imported.
+    """
+
+    def __init__(self, mode: str = EXECUTOR_MODE, workers: int = EXECUTOR_WORKERS):
+        if mode not in ["thread", "process"]:
+            msg.warn(f"Unknown VERBA_EXECUTOR {mode}, using thread")
+            mode = "thread"
+        self.mode = mode
+        self.workers = workers
+        self.thread_pool: ThreadPoolExecutor | None = None
+        self.process_pool: ProcessPoolExecutor | None = None
+        self.stats: dict[str, dict] = {}
+        self.lock = threading.Lock()
+
+    def get_pool(self, cpu: bool) -> Executor:
+        with self.lock:
+            if cpu and self.mode == "process":
+                if self.process_pool is None:
+                    self.process_pool = ProcessPoolExecutor(max_workers=self.workers)
+                return self.process_pool
+            if self.thread_pool is None:
+                self.thread_pool = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="verba-offload"
+                )
+            return self.thread_pool
+
+    async def run(
+        self, func: Callable[..., Any], *args, cpu: bool = False, **kwargs
+    ) -> Any:
+        """Run func in the executor and await its result.
+        Set cpu for picklable CPU bound functions, they run in a process pool if VERBA_EXECUTOR is process.
+        """
+        loop = asyncio.get_running_loop()
+        start_time = time.perf_counter()
+        try:
+            return await loop.run_in_executor(
+                self.get_pool(cpu), partial(func, *args, **kwargs)
+            )
+        finally:
+            self.record(
+                getattr(func, "__name__", "task"), time.perf_counter() - start_time
+            )
+
+    def record(self, name: str, took: float):
+        with self.lock:
+            stats = self.stats.setdefault(name, {"calls": 0, "took": 0.0})
+            stats["calls"] += 1
+            stats["took"] += took
+
+    def get_report(self) -> dict:
+        with self.lock:
+            return {
+                "mode": self.mode,
+                "workers": self.workers,
+                "tasks": {
+                    name: {
+                        "calls": stats["calls"],
+                        "took": round(stats["took"], 4),
+                        "average": round(stats["took"] / stats["calls"], 4),
+                    }
+                    for name, stats in self.stats.items()
+                },
+            }
+
+    def shutdown(self):
+        with self.lock:
+            if self.thread_pool is not None:
+                self.thread_pool.shutdown(wait=False, cancel_futures=True)
+                self.thread_pool = None
+            if self.process_pool is not None:
+                self.process_pool.shutdown(wait=False, cancel_futures=True)
+                self.process_pool = None
+
+
+class LoopLagMonitor:
+    """
+    Measures how much later than scheduled the event loop wakes up from a fixed sleep.
+    Blocking calls on the loop show up as lag.
+    """
+
+    def __init__(
+        self, interval: float = LOOP_LAG_INTERVAL, window: int = LOOP_LAG_WINDOW
+    ):
+        self.interval = interval
+        self.samples: deque[float] = deque(maxlen=window)
+        self.task: asyncio.Task | None = None
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.monitor())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    async def monitor(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start_time = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - start_time - self.interval))
+
+    def get_report(self) -> dict:
+        """Return lag statistics in milliseconds over the last measurements"""
+        samples = sorted(self.samples)
+        if not samples:
+            return {"samples": 0, "last": None, "mean": None, "p95": None, "max": None}
+        return {
+            "samples": len(samples),
+            "last": round(self.samples[-1] * 1000, 2),
+            "mean": round(sum(samples) / len(samples) * 1000, 2),
+            "p95": round(samples[int(0.95 * (len(samples) - 1))] * 1000, 2),
+            "max": round(samples[-1] * 1000, 2),
+        }
+
+
+offload_executor = OffloadExecutor()
+loop_lag_monitor = LoopLagMonitor()
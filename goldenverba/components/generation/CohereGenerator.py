@@ -1,12 +1,16 @@
 import os
 import json
-import aiohttp
 from typing import List, Dict, AsyncGenerator
 
 from goldenverba.components.interfaces import Generator
 from goldenverba.components.types import InputConfig
-from goldenverba.components.embedding.CohereEmbedder import get_models
+from goldenverba.components.embedding.CohereEmbedder import (
+    get_models,
+    DEFAULT_MODELS,
+)
+from goldenverba.components.discovery import cache_key
 from goldenverba.components.util import get_environment, get_token
+from goldenverba.components.sessions import http_sessions
 
 
 class CohereGenerator(Generator):
@@ -21,7 +25,15 @@ class CohereGenerator(Generator):
         self.url = os.getenv("COHERE_BASE_URL", "https://api.cohere.com/v1")
         self.context_window = 10000
 
-        models = get_models(self.url, get_token("COHERE_API_KEY", None), "chat")
+        token = get_token("COHERE_API_KEY", None)
+        if token is None:
+            models = DEFAULT_MODELS
+        else:
+            models = self.discover_models(
+                cache_key("cohere-chat", self.url, token),
+                lambda: get_models(self.url, token, "chat"),
+                DEFAULT_MODELS,
+            )
 
         self.config["Model"] = InputConfig(
             type="dropdown",
@@ -74,7 +86,7 @@ class CohereGenerator(Generator):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_sessions.session() as session:
                 async with session.post(
                     self.url + "/chat", json=data, headers=headers
                 ) as response:
@@ -1,6 +1,5 @@
 import json
 import os
-import aiohttp
 from typing import Any, AsyncGenerator, List, Dict
 from wasabi import msg
 import requests
@@ -8,6 +7,8 @@ import requests
 from goldenverba.components.interfaces import Generator
 from goldenverba.components.types import InputConfig
 from goldenverba.components.util import get_environment
+from goldenverba.components.discovery import cache_key
+from goldenverba.components.sessions import http_sessions
 
 GROQ_BASE_URL = "https://api.groq.com/openai/v1/"
 DEFAULT_TEMPERATURE = 0.2
@@ -36,7 +37,14 @@ class GroqGenerator(Generator):
         env_api_key = os.getenv("GROQ_API_KEY")
 
         # Fetch available models
-        models = get_models(self.url, env_api_key)
+        if env_api_key is None:
+            models = DEFAULT_MODEL_LIST
+        else:
+            models = self.discover_models(
+                cache_key("groq", self.url, env_api_key),
+                lambda: get_models(self.url, env_api_key),
+                DEFAULT_MODEL_LIST,
+            )
 
         # Configure the model selection dropdown
         self.config["Model"] = InputConfig(
@@ -88,7 +96,7 @@ class GroqGenerator(Generator):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_sessions.session() as session:
                 async with session.post(
                     self.url + "/chat/completions", json=data, headers=headers
                 ) as response:
@@ -166,25 +174,22 @@ class GroqGenerator(Generator):
 
 def get_models(url: str, api_key: str) -> List[str]:
     """
-    Fetch online and return available Groq models if api_key is not empty and valid.
-    Else, return offline default model list.
+    Fetch online and return available Groq models, raises if the Groq API can't be reached.
+    Returns the offline default model list if no LLM is available.
     """
-    try:
-        headers = {"Authorization": f"Bearer {api_key}"}
-        response = requests.get(url + "models", headers=headers)
-        models = [
-            model.get("id")
-            for model in response.json().get("data")
-            if model.get("active") is True
-        ]
-        models.sort()
-        models = filter_models(models)
-        if len(models) == 0:
-            return DEFAULT_MODEL_LIST
-        return models
-
-    except Exception as e:
+    headers = {"Authorization": f"Bearer {api_key}"}
+    response = requests.get(url + "models", headers=headers, timeout=10)
+    response.raise_for_status()
+    models = [
+        model.get("id")
+        for model in response.json().get("data")
+        if model.get("active") is True
+    ]
+    models.sort()
+    models = filter_models(models)
+    if len(models) == 0:
         return DEFAULT_MODEL_LIST
+    return models
 
 
 def filter_models(models: List[str]) -> List[str]:
@@ -1,12 +1,13 @@
 import os
 import json
-import aiohttp
 from urllib.parse import urljoin
 from typing import List, Dict, AsyncGenerator
 
 from goldenverba.components.interfaces import Generator
 from goldenverba.components.embedding.OllamaEmbedder import get_models
 from goldenverba.components.types import InputConfig
+from goldenverba.components.discovery import cache_key
+from goldenverba.components.sessions import http_sessions
 
 
 class OllamaGenerator(Generator):
@@ -18,7 +19,11 @@ class OllamaGenerator(Generator):
         self.context_window = 10000
 
         # Fetch available models
-        models = get_models(self.url)
+        models = self.discover_models(
+            cache_key("ollama", self.url),
+            lambda: get_models(self.url),
+            [f"Couldn't connect to Ollama {self.url}"],
+        )
 
         # Configure the model selection dropdown
         self.config["Model"] = InputConfig(
@@ -46,7 +51,7 @@ class OllamaGenerator(Generator):
         data = {"model": model, "messages": messages}
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_sessions.session() as session:
                 async with session.post(urljoin(self.url, "/api/chat"), json=data) as response:
                     async for line in response.content:
                         if line.strip():
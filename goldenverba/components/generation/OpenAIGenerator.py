@@ -3,13 +3,16 @@ from dotenv import load_dotenv
 from goldenverba.components.interfaces import Generator
 from goldenverba.components.types import InputConfig
 from goldenverba.components.util import get_environment, get_token
+from goldenverba.components.discovery import cache_key
+from goldenverba.components.sessions import http_sessions
 from typing import List
-import httpx
 import json
 from wasabi import msg
 
 load_dotenv()
 
+DEFAULT_MODELS = ["gpt-4o", "gpt-3.5-turbo"]
+
 
 class OpenAIGenerator(Generator):
     """
@@ -24,7 +27,14 @@ class OpenAIGenerator(Generator):
 
         api_key = get_token("OPENAI_API_KEY")
         base_url = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
-        models = self.get_models(api_key, base_url)
+        if api_key is None:
+            models = DEFAULT_MODELS
+        else:
+            models = self.discover_models(
+                cache_key("openai-generation", base_url, api_key),
+                lambda: self.get_models(api_key, base_url),
+                DEFAULT_MODELS,
+            )
 
         self.config["Model"] = InputConfig(
             type="dropdown",
@@ -76,7 +86,7 @@ class OpenAIGenerator(Generator):
             "stream": True,
         }
 
-        async with httpx.AsyncClient() as client:
+        async with http_sessions.httpx_client() as client:
             async with client.stream(
                 "POST",
                 f"{openai_url}/chat/completions",
@@ -124,22 +134,14 @@ class OpenAIGenerator(Generator):
         return messages
 
     def get_models(self, token: str, url: str) -> List[str]:
-        """Fetch available embedding models from OpenAI API."""
-        default_models = ["gpt-4o", "gpt-3.5-turbo"]
-        try:
-            if token is None:
-                return default_models
-
-            import requests
-
-            headers = {"Authorization": f"Bearer {token}"}
-            response = requests.get(f"{url}/models", headers=headers)
-            response.raise_for_status()
-            return [
-                model["id"]
-                for model in response.json()["data"]
-                if not "embedding" in model["id"]
-            ]
-        except Exception as e:
-            msg.info(f"Failed to fetch OpenAI models: {str(e)}")
-            return default_models
+        """Fetch available models from OpenAI API, raises on failure."""
+        import requests
+
+        headers = {"Authorization": f"Bearer {token}"}
+        response = requests.get(f"{url}/models", headers=headers, timeout=10)
+        response.raise_for_status()
+        return [
+            model["id"]
+            for model in response.json()["data"]
+            if not "embedding" in model["id"]
+        ]
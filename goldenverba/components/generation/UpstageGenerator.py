@@ -3,12 +3,12 @@ from dotenv import load_dotenv
 from goldenverba.components.interfaces import Generator
 from goldenverba.components.types import InputConfig
 from goldenverba.components.util import get_environment, get_token
-import httpx
 import json
 
 from goldenverba.components.interfaces import Generator
 from goldenverba.components.types import InputConfig
 from goldenverba.components.util import get_environment, get_token
+from goldenverba.components.sessions import http_sessions
 
 load_dotenv()
 
@@ -81,7 +81,7 @@ class UpstageGenerator(Generator):
             "stream": True,
         }
 
-        async with httpx.AsyncClient() as client:
+        async with http_sessions.httpx_client() as client:
             async with client.stream(
                 "POST",
                 f"{base_url}/chat/completions",
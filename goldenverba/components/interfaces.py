@@ -1,14 +1,28 @@
 from goldenverba.components.document import Document
+from goldenverba.components.discovery import model_discovery
 from goldenverba.server.types import FileConfig
 from goldenverba.components.types import InputConfig
+from goldenverba.components.embedding_scheduler import (
+    EmbeddingScheduler,
+    EMBEDDING_RATE_LIMIT,
+    pack_batches,
+)
+from goldenverba.components.executor import offload_executor
+from goldenverba.components.tokens import DEFAULT_ENCODING, estimate_tokens
 
 from dotenv import load_dotenv
 
 from wasabi import msg
 from weaviate import Client
 
+import asyncio
+import os
+
 load_dotenv()
 
+# Amount of batches an Embedder vectorizes at the same time
+EMBEDDING_CONCURRENCY = int(os.getenv("VERBA_EMBEDDING_CONCURRENCY", "4"))
+
 
 class VerbaComponent:
     """
@@ -22,9 +36,33 @@ class VerbaComponent:
         self.description = ""
         self.config = {}
         self.type = ""
+        self.model_source = None
+
+    def discover_models(self, key: str, fetch, default: list[str]) -> list[str]:
+        """Return the cached model list without blocking, it is refreshed in the background
+        @parameter: key : str - Cache key, see discovery.cache_key
+        @parameter: fetch : Callable - Blocking function returning the model names, raises on failure
+        @parameter: default : list[str] - Models to use until the first fetch succeeded
+        @returns list[str] - Model names
+        """
+        self.model_source = (key, fetch, default)
+        return model_discovery.get_models(key, fetch, default)
+
+    def update_models(self):
+        """Apply the latest discovered models to the Model dropdown"""
+        if self.model_source is None or "Model" not in self.config:
+            return
+        models = model_discovery.get_models(*self.model_source)
+        model_config = self.config["Model"]
+        if models and model_config.values != models:
+            model_config.values = models
+            if model_config.value not in models:
+                model_config.value = models[0]
 
     def get_meta(self, envs, libs) -> dict:
 
+        self.update_models()
+
         if len(self.config) > 0:
             config = {_c: self.config[_c].model_dump() for _c in self.config}
         else:
@@ -78,6 +116,12 @@ class Embedding(VerbaComponent):
     def __init__(self):
         super().__init__()
         self.max_batch_size = 128
+        # Maximum estimated tokens per request (None if the provider only limits the amount of texts)
+        self.max_batch_tokens: int | None = None
+        self.token_encoding = DEFAULT_ENCODING
+        self.max_concurrency = EMBEDDING_CONCURRENCY
+        self.requests_per_second = EMBEDDING_RATE_LIMIT
+        self.scheduler: EmbeddingScheduler | None = None
 
     async def vectorize(self, config: dict, content: list[str]) -> list[float]:
         """Embed verba documents and its chunks to Weaviate
@@ -87,6 +131,59 @@ class Embedding(VerbaComponent):
         """
         raise NotImplementedError("embed method must be implemented by a subclass.")
 
+    def get_scheduler(self) -> EmbeddingScheduler:
+        """Return the scheduler shared by all requests of this Embedder"""
+        if self.scheduler is None:
+            self.scheduler = EmbeddingScheduler(
+                self.name, self.max_concurrency, self.requests_per_second
+            )
+        return self.scheduler
+
+    async def batch_vectorize(
+        self, config: dict, content: list[str]
+    ) -> list[list[float]]:
+        """Embed content in batches of at most max_batch_size texts and max_batch_tokens estimated tokens,
+        requests of all imports are limited by the Embedder's scheduler
+        @parameter: config : dict - Embedder Configuration
+        @parameter: content : list[str] - List of strings to embed
+        @return: list[list[float]] - List of embeddings in the order of content
+        """
+        scheduler = self.get_scheduler()
+        batch_size = scheduler.get_batch_size(self.max_batch_size)
+        token_counts = None
+        if self.max_batch_tokens is not None:
+            token_counts = await offload_executor.run(
+                estimate_tokens, content, self.token_encoding
+            )
+        batches = pack_batches(content, batch_size, self.max_batch_tokens, token_counts)
+
+        async def vectorize_batch(batch: list[str]) -> list[list[float]]:
+            return await self.vectorize(config, batch)
+
+        results = await asyncio.gather(
+            *[scheduler.vectorize(vectorize_batch, batch) for batch in batches],
+            return_exceptions=True,
+        )
+
+        # Check if all tasks were successful
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors:
+            error_messages = [str(e) for e in errors]
+            raise Exception(
+                f"Vectorization failed for some batches: {', '.join(error_messages)}"
+            )
+
+        # Flatten the results
+        flattened_results = [item for sublist in results for item in sublist]
+
+        # Verify the number of vectors matches the input content
+        if len(flattened_results) != len(content):
+            raise Exception(
+                f"Mismatch in vectorization results: expected {len(content)} vectors, got {len(flattened_results)}"
+            )
+
+        return flattened_results
+
 
 class Chunker(VerbaComponent):
     """
@@ -96,6 +193,10 @@ class Chunker(VerbaComponent):
     def __init__(self):
         super().__init__()
         self.config = {}
+        # Whether the Chunker reads Document.spacy_doc
+        self.requires_spacy = False
+        # Whether the Chunker calls the Embedder, other Chunkers run in the offload executor
+        self.requires_embedder = False
 
     async def chunk(
         self,
@@ -10,15 +10,18 @@ from weaviate.classes.init import AdditionalConfig, Timeout
 
 import os
 import asyncio
+import hashlib
 import json
 import re
+import numpy as np
 from urllib.parse import urlparse
 from datetime import datetime
 
 from sklearn.decomposition import PCA
 
 
-from goldenverba.components.document import Document
+from goldenverba.components.document import Document, parse_documents
+from goldenverba.components.chunk import Chunk, ChunkVectors
 from goldenverba.components.interfaces import (
     Reader,
     Chunker,
@@ -26,6 +29,13 @@ from goldenverba.components.interfaces import (
     Retriever,
     Generator,
 )
+from goldenverba.components.registry import ComponentRegistry
+from goldenverba.components.executor import offload_executor
+from goldenverba.components.embedding_cache import (
+    embedding_cache,
+    get_cache_settings,
+    query_cache,
+)
 from goldenverba.server.helpers import LoggerManager
 from goldenverba.server.types import FileConfig, FileStatus
 
@@ -42,6 +52,7 @@ from goldenverba.components.reader.UpstageDocumentParse import (
 
 # Import Chunkers
 from goldenverba.components.chunking.TokenChunker import TokenChunker
+from goldenverba.components.chunking.TokenizerChunker import TokenizerChunker
 from goldenverba.components.chunking.SentenceChunker import SentenceChunker
 from goldenverba.components.chunking.RecursiveChunker import RecursiveChunker
 from goldenverba.components.chunking.HTMLChunker import HTMLChunker
@@ -60,6 +71,9 @@ from goldenverba.components.embedding.VoyageAIEmbedder import VoyageAIEmbedder
 from goldenverba.components.embedding.SentenceTransformersEmbedder import (
     SentenceTransformersEmbedder,
 )
+from goldenverba.components.embedding.EmbeddingServerEmbedder import (
+    EmbeddingServerEmbedder,
+)
 
 # Import Retrievers
 from goldenverba.components.retriever.WindowRetriever import WindowRetriever
@@ -81,77 +95,133 @@ except Exception:
 
 production = os.getenv("VERBA_PRODUCTION")
 if production != "Production":
-    readers = [
-        BasicReader(),
-        HTMLReader(),
-        GitReader(),
-        UnstructuredReader(),
-        AssemblyAIReader(),
-        FirecrawlReader(),
-        UpstageDocumentParseReader(),
-    ]
-    chunkers = [
-        TokenChunker(),
-        SentenceChunker(),
-        RecursiveChunker(),
-        SemanticChunker(),
-        HTMLChunker(),
-        MarkdownChunker(),
-        CodeChunker(),
-        JSONChunker(),
-    ]
-    embedders = [
-        OllamaEmbedder(),
-        SentenceTransformersEmbedder(),
-        WeaviateEmbedder(),
-        UpstageEmbedder(),
-        VoyageAIEmbedder(),
-        CohereEmbedder(),
-        OpenAIEmbedder(),
-    ]
-    retrievers = [WindowRetriever()]
-    generators = [
-        OllamaGenerator(),
-        OpenAIGenerator(),
-        AnthropicGenerator(),
-        CohereGenerator(),
-        GroqGenerator(),
-        UpstageGenerator(),
-    ]
+    readers = ComponentRegistry(
+        "Reader",
+        {
+            "Default": BasicReader,
+            "HTML": HTMLReader,
+            "Git": GitReader,
+            "Unstructured IO": UnstructuredReader,
+            "AssemblyAI": AssemblyAIReader,
+            "Firecrawl": FirecrawlReader,
+            "Upstage Parser": UpstageDocumentParseReader,
+        },
+    )
+    chunkers = ComponentRegistry(
+        "Chunker",
+        {
+            "Token": TokenChunker,
+            "Tokenizer": TokenizerChunker,
+            "Sentence": SentenceChunker,
+            "Recursive": RecursiveChunker,
+            "Semantic": SemanticChunker,
+            "HTML": HTMLChunker,
+            "Markdown": MarkdownChunker,
+            "Code": CodeChunker,
+            "JSON": JSONChunker,
+        },
+    )
+    embedders = ComponentRegistry(
+        "Embedder",
+        {
+            "Ollama": OllamaEmbedder,
+            "SentenceTransformers": SentenceTransformersEmbedder,
+            "Embedding Server": EmbeddingServerEmbedder,
+            "Weaviate": WeaviateEmbedder,
+            "Upstage": UpstageEmbedder,
+            "VoyageAI": VoyageAIEmbedder,
+            "Cohere": CohereEmbedder,
+            "OpenAI": OpenAIEmbedder,
+        },
+    )
+    retrievers = ComponentRegistry("Retriever", {"Advanced": WindowRetriever})
+    generators = ComponentRegistry(
+        "Generator",
+        {
+            "Ollama": OllamaGenerator,
+            "OpenAI": OpenAIGenerator,
+            "Anthropic": AnthropicGenerator,
+            "Cohere": CohereGenerator,
+            "Groq": GroqGenerator,
+            "Upstage": UpstageGenerator,
+        },
+    )
 else:
-    readers = [
-        BasicReader(),
-        HTMLReader(),
-        GitReader(),
-        UnstructuredReader(),
-        AssemblyAIReader(),
-        FirecrawlReader(),
-        UpstageDocumentParseReader(),
-    ]
-    chunkers = [
-        TokenChunker(),
-        SentenceChunker(),
-        RecursiveChunker(),
-        SemanticChunker(),
-        HTMLChunker(),
-        MarkdownChunker(),
-        CodeChunker(),
-        JSONChunker(),
-    ]
-    embedders = [
-        WeaviateEmbedder(),
-        VoyageAIEmbedder(),
-        UpstageEmbedder(),
-        CohereEmbedder(),
-        OpenAIEmbedder(),
-    ]
-    retrievers = [WindowRetriever()]
-    generators = [
-        OpenAIGenerator(),
-        AnthropicGenerator(),
-        CohereGenerator(),
-        UpstageGenerator(),
-    ]
+    readers = ComponentRegistry(
+        "Reader",
+        {
+            "Default": BasicReader,
+            "HTML": HTMLReader,
+            "Git": GitReader,
+            "Unstructured IO": UnstructuredReader,
+            "AssemblyAI": AssemblyAIReader,
+            "Firecrawl": FirecrawlReader,
+            "Upstage Parser": UpstageDocumentParseReader,
+        },
+    )
+    chunkers = ComponentRegistry(
+        "Chunker",
+        {
+            "Token": TokenChunker,
+            "Tokenizer": TokenizerChunker,
+            "Sentence": SentenceChunker,
+            "Recursive": RecursiveChunker,
+            "Semantic": SemanticChunker,
+            "HTML": HTMLChunker,
+            "Markdown": MarkdownChunker,
+            "Code": CodeChunker,
+            "JSON": JSONChunker,
+        },
+    )
+    embedders = ComponentRegistry(
+        "Embedder",
+        {
+            "Weaviate": WeaviateEmbedder,
+            "VoyageAI": VoyageAIEmbedder,
+            "Upstage": UpstageEmbedder,
+            "Cohere": CohereEmbedder,
+            "OpenAI": OpenAIEmbedder,
+        },
+    )
+    retrievers = ComponentRegistry("Retriever", {"Advanced": WindowRetriever})
+    generators = ComponentRegistry(
+        "Generator",
+        {
+            "OpenAI": OpenAIGenerator,
+            "Anthropic": AnthropicGenerator,
+            "Cohere": CohereGenerator,
+            "Upstage": UpstageGenerator,
+        },
+    )
+
+
+def compute_pca(embeddings: np.ndarray) -> np.ndarray:
+    """Reduce a float32 embedding matrix to three dimensions, runs in the offload executor"""
+    pca = PCA(n_components=3)
+    return pca.fit_transform(embeddings).astype(np.float32)
+
+
+def sum_embedding_statistics(statistics: list[dict]) -> dict:
+    """Add up the Embedding Statistics of several documents, e.g. of one import"""
+    total = {"chunks": 0, "reused": 0, "embedded": 0, "duplicates": 0}
+    for document_statistics in statistics:
+        for name in total:
+            total[name] += document_statistics.get(name, 0)
+    return total
+
+
+def chunk_documents(
+    chunker: str, config: dict, documents: list[Document], embedder_config: dict
+) -> list[tuple[list[Chunk], dict]]:
+    """Chunk documents with a Chunker that doesn't need an Embedder, runs in the offload executor.
+    Returns the chunks and meta of every document.
+    """
+    chunked_documents = asyncio.run(
+        chunkers[chunker].chunk(
+            config=config, documents=documents, embedder_config=embedder_config
+        )
+    )
+    return [(document.chunks, document.meta) for document in chunked_documents]
 
 
 ### ----------------------- ###
@@ -336,7 +406,7 @@ class WeaviateManager:
     async def verify_embedding_collections(
         self, client: WeaviateAsyncClient, environment_variables, libraries
     ):
-        for embedder in embedders:
+        for embedder in embedders.values():
             if embedder.check_available(environment_variables, libraries):
                 if "Model" in embedder.config:
                     for _embedder in embedder.config["Model"].values:
@@ -411,6 +481,7 @@ class WeaviateManager:
                     chunk.labels = document.labels
                     chunk.title = document.title
 
+                # Vectors are float32 rows of document.vectors, the client converts each row to a list of floats while packing the request
                 chunk_response = await embedder_collection.data.insert_many(
                     [
                         DataObject(properties=chunk.to_json(), vector=chunk.vector)
@@ -712,18 +783,19 @@ class WeaviateManager:
                             }
                         else:
                             continue
-                    vector_list.append(item.vector["default"])
+                    vector_list.append(
+                        np.asarray(item.vector["default"], dtype=np.float32)
+                    )
                     dimensions = len(item.vector["default"])
                     vector_ids.append(doc_uuid)
                     vector_chunk_uuids.append(chunk_uuid)
                     vector_chunk_ids.append(item.properties["chunk_id"])
 
                 if len(vector_ids) > 3:
-                    pca = PCA(n_components=3)
-                    generated_pca_embeddings = pca.fit_transform(vector_list)
-                    pca_embeddings = [
-                        pca_.tolist() for pca_ in generated_pca_embeddings
-                    ]
+                    pca_embeddings = await offload_executor.run(
+                        compute_pca, np.stack(vector_list), cpu=True
+                    )
+                    pca_embeddings = pca_embeddings.tolist()
 
                     for pca_embedding, _uuid, _chunk_uuid, _chunk_id in zip(
                         pca_embeddings,
@@ -908,7 +980,7 @@ class WeaviateManager:
 
     ### Cache Logic
 
-    # TODO: Implement Cache Logic
+    # Embeddings are cached locally by EmbeddingManager, see goldenverba/components/embedding_cache.py
 
     ### Metadata Retrieval
 
@@ -951,7 +1023,7 @@ class WeaviateManager:
 
 class ReaderManager:
     def __init__(self):
-        self.readers: dict[str, Reader] = {reader.name: reader for reader in readers}
+        self.readers: ComponentRegistry = readers
 
     async def load(
         self, reader: str, fileConfig: FileConfig, logger: LoggerManager
@@ -996,9 +1068,31 @@ class ReaderManager:
 
 class ChunkerManager:
     def __init__(self):
-        self.chunkers: dict[str, Chunker] = {
-            chunker.name: chunker for chunker in chunkers
-        }
+        self.chunkers: ComponentRegistry = chunkers
+
+    def chunks_in_processes(self, chunker: str) -> bool:
+        """Chunkers that don't call an Embedder run in the process pool if VERBA_EXECUTOR is process"""
+        return (
+            offload_executor.mode == "process"
+            and not self.chunkers[chunker].requires_embedder
+        )
+
+    async def parse_documents(self, chunker: str, documents: list[Document]):
+        """Parse the spaCy docs of all documents in the offload executor if the Chunker requires spaCy"""
+        if chunker not in self.chunkers or not self.chunkers[chunker].requires_spacy:
+            return
+        # Worker processes parse the documents they chunk themselves
+        if self.chunks_in_processes(chunker):
+            return
+        await offload_executor.run(self.parse_spacy_docs, documents)
+
+    @staticmethod
+    def parse_spacy_docs(documents: list[Document]):
+        # Multi-document imports are parsed in batches, the remaining documents one by one
+        if len(documents) > 1:
+            parse_documents(documents)
+        for document in documents:
+            document.spacy_doc
 
     async def chunk(
         self,
@@ -1016,18 +1110,44 @@ class ChunkerManager:
                 embedder_config = (
                     fileConfig.rag_config["Embedder"].components[embedder.name].config
                 )
-                chunked_documents = await self.chunkers[chunker].chunk(
-                    config=config,
-                    documents=documents,
-                    embedder=embedder,
-                    embedder_config=embedder_config,
-                )
+                if self.chunkers[chunker].requires_embedder:
+                    chunked_documents = await self.chunkers[chunker].chunk(
+                        config=config,
+                        documents=documents,
+                        embedder=embedder,
+                        embedder_config=embedder_config,
+                    )
+                else:
+                    # Documents of an import are chunked in parallel, each one is embedded as soon as its chunks are back
+                    results = await offload_executor.run(
+                        chunk_documents,
+                        chunker,
+                        config,
+                        documents,
+                        embedder_config,
+                        cpu=True,
+                    )
+                    for document, (chunks, meta) in zip(documents, results):
+                        for chunk in chunks:
+                            # Point views at the document content of this process
+                            if chunk.source is not None:
+                                chunk.source = document.content
+                        document.chunks = chunks
+                        document.meta = meta
+                    chunked_documents = documents
                 for chunked_document in chunked_documents:
                     chunked_document.meta["Chunker"] = (
                         fileConfig.rag_config["Chunker"]
                         .components[chunker]
                         .model_dump()
                     )
+                    # Release the parsed spaCy doc, chunks only need the document content
+                    chunked_document.spacy_doc = None
+                    # Pages of the document can be sliced from its content if all chunks are views of it
+                    chunked_document.meta["Exact Offsets"] = all(
+                        chunk.source is chunked_document.content
+                        for chunk in chunked_document.chunks
+                    )
                 elapsed_time = round(loop.time() - start_time, 2)
                 if len(documents) == 1:
                     await logger.send_report(
@@ -1056,9 +1176,7 @@ class ChunkerManager:
 
 class EmbeddingManager:
     def __init__(self):
-        self.embedders: dict[str, Embedding] = {
-            embedder.name: embedder for embedder in embedders
-        }
+        self.embedders: ComponentRegistry = embedders
 
     async def vectorize(
         self,
@@ -1066,9 +1184,11 @@ class EmbeddingManager:
         fileConfig: FileConfig,
         documents: list[Document],
         logger: LoggerManager,
+        import_vectors: dict[bytes, asyncio.Future] | None = None,
     ) -> list[Document]:
         """Vectorizes chunks in batches
         @parameter: documents : Document - Verba document
+        @parameter: import_vectors : dict - Vectors by text hash, shared by all vectorize calls of one import
         @returns Document - Document with vectorized chunks
         """
         try:
@@ -1077,39 +1197,148 @@ class EmbeddingManager:
             if embedder in self.embedders:
                 config = fileConfig.rag_config["Embedder"].components[embedder].config
 
+                # Identical texts (license headers, navigation, boilerplate) across all documents
+                # of the import are embedded once by the first document that contains them,
+                # the other documents wait for the vector in import_vectors.
+                # Texts are keyed by their hash, only the texts to embed are kept until the request
+                if import_vectors is None:
+                    import_vectors = {}
+                unique_content: dict[bytes, int] = {}
+                pending: list[str] = []
+                owned: list[tuple[bytes, asyncio.Future]] = []
+                chunk_rows: list[dict[int, int]] = []
+                document_statistics: list[dict] = []
                 for document in documents:
-                    content = [
-                        document.metadata + "\n" + chunk.content
-                        for chunk in document.chunks
-                    ]
-                    embeddings = await self.batch_vectorize(embedder, config, content)
+                    # Chunks that already got a vector while chunking are not embedded again
+                    rows = {}
+                    statistics = {
+                        "chunks": 0,
+                        "reused": 0,
+                        "embedded": 0,
+                        "duplicates": 0,
+                    }
+                    for chunk in document.chunks:
+                        statistics["chunks"] += 1
+                        if chunk.chunk_id in document.chunk_vectors:
+                            statistics["reused"] += 1
+                            continue
+                        text = document.metadata + "\n" + chunk.content
+                        key = hashlib.sha256(text.encode("utf-8")).digest()
+                        embedded = False
+                        if key not in unique_content:
+                            unique_content[key] = len(unique_content)
+                            if key not in import_vectors:
+                                future = loop.create_future()
+                                import_vectors[key] = future
+                                owned.append((key, future))
+                                pending.append(text)
+                                embedded = True
+                        rows[chunk.chunk_id] = unique_content[key]
+                        if embedded:
+                            statistics["embedded"] += 1
+                        else:
+                            statistics["duplicates"] += 1
+                    chunk_rows.append(rows)
+                    document_statistics.append(statistics)
 
-                    if len(embeddings) >= 3:
-                        pca = PCA(n_components=3)
-                        generated_pca_embeddings = pca.fit_transform(embeddings)
-                        pca_embeddings = [
-                            pca_.tolist() for pca_ in generated_pca_embeddings
+                futures = [import_vectors[key] for key in unique_content]
+
+                total = sum_embedding_statistics(document_statistics)
+                msg.info(
+                    f"Embedding {total['embedded']} unique texts for {total['chunks']} chunks ({total['duplicates']} duplicates, {total['reused']} reused from chunking)"
+                )
+
+                if len(pending) > 0:
+                    try:
+                        vectors = await self.batch_vectorize(embedder, config, pending)
+                        pending = []
+                        for (_, future), vector in zip(owned, vectors):
+                            future.set_result(np.asarray(vector, dtype=np.float32))
+                    except Exception as e:
+                        for key, future in owned:
+                            del import_vectors[key]
+                            future.set_exception(e)
+                            # Mark the error as retrieved in case no other document waits for it
+                            future.exception()
+                        raise
+                    finally:
+                        # A cancelled import must not leave other documents waiting
+                        for key, future in owned:
+                            if not future.done():
+                                import_vectors.pop(key, None)
+                                future.cancel()
+
+                embeddings = await asyncio.gather(*futures, return_exceptions=True)
+                failed = {
+                    row
+                    for row, embedding in enumerate(embeddings)
+                    if isinstance(embedding, BaseException)
+                }
+                if failed:
+                    # Another document failed to embed texts shared with this one, embed them here instead
+                    retry_content: dict[int, str] = {}
+                    for document, rows, statistics in zip(
+                        documents, chunk_rows, document_statistics
+                    ):
+                        for chunk in document.chunks:
+                            row = rows.get(chunk.chunk_id)
+                            if row in failed and row not in retry_content:
+                                retry_content[row] = (
+                                    document.metadata + "\n" + chunk.content
+                                )
+                                statistics["embedded"] += 1
+                                statistics["duplicates"] -= 1
+                    vectors = await self.batch_vectorize(
+                        embedder, config, list(retry_content.values())
+                    )
+                    for row, vector in zip(retry_content, vectors):
+                        embeddings[row] = np.asarray(vector, dtype=np.float32)
+                    retry_content = {}
+                unique_content = {}
+                owned = []
+                futures = []
+
+                for document, rows, statistics in zip(
+                    documents, chunk_rows, document_statistics
+                ):
+                    # One float32 matrix per document is used for PCA and the import
+                    chunk_vectors = ChunkVectors.from_rows(
+                        [
+                            (
+                                document.chunk_vectors[chunk.chunk_id]
+                                if chunk.chunk_id in document.chunk_vectors
+                                else embeddings[rows[chunk.chunk_id]]
+                            )
+                            for chunk in document.chunks
                         ]
+                    )
+                    document.chunk_vectors = {}
+
+                    if len(chunk_vectors) == 0:
+                        chunk_vectors.pca = np.empty((0, 3), dtype=np.float32)
+                    elif len(chunk_vectors) >= 3:
+                        chunk_vectors.pca = await offload_executor.run(
+                            compute_pca, chunk_vectors.matrix, cpu=True
+                        )
                     else:
-                        pca_embeddings = [embedding[0:3] for embedding in embeddings]
+                        chunk_vectors.pca = chunk_vectors.matrix[:, 0:3].copy()
 
-                    for vector, chunk, pca_ in zip(
-                        embeddings, document.chunks, pca_embeddings
-                    ):
-                        chunk.vector = vector
-                        chunk.pca = pca_
+                    chunk_vectors.assign(document.chunks)
+                    document.vectors = chunk_vectors
 
                     document.meta["Embedder"] = (
                         fileConfig.rag_config["Embedder"]
                         .components[embedder]
                         .model_dump()
                     )
+                    document.meta["Embedding Statistics"] = statistics
 
+                total = sum_embedding_statistics(document_statistics)
                 elapsed_time = round(loop.time() - start_time, 2)
                 await logger.send_report(
                     fileConfig.fileID,
                     FileStatus.EMBEDDING,
-                    f"Vectorized all chunks",
+                    f"Vectorized all chunks ({total['duplicates']} duplicates skipped)",
                     took=elapsed_time,
                 )
                 await logger.send_report(
@@ -1124,36 +1353,32 @@ class EmbeddingManager:
     async def batch_vectorize(
         self, embedder: str, config: dict, content: list[str]
     ) -> list[list[float]]:
-        """Vectorize content in batches"""
+        """Vectorize content in batches, texts embedded before with the same settings are read from the embedding cache"""
         try:
-            batches = [
-                content[i : i + self.embedders[embedder].max_batch_size]
-                for i in range(0, len(content), self.embedders[embedder].max_batch_size)
-            ]
-            msg.info(f"Vectorizing {len(content)} chunks in {len(batches)} batches")
-            tasks = [
-                self.embedders[embedder].vectorize(config, batch) for batch in batches
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Check if all tasks were successful
-            errors = [r for r in results if isinstance(r, Exception)]
-            if errors:
-                error_messages = [str(e) for e in errors]
-                raise Exception(
-                    f"Vectorization failed for some batches: {', '.join(error_messages)}"
+            embedding = self.embedders[embedder]
+            settings = get_cache_settings(config)
+            vectors = await offload_executor.run(
+                embedding_cache.get_many, embedder, settings, content
+            )
+            missing = [i for i, vector in enumerate(vectors) if vector is None]
+            msg.info(
+                f"Vectorizing {len(missing)} chunks in batches of {embedding.max_batch_size} ({len(content) - len(missing)} cached)"
+            )
+            if len(missing) > 0:
+                missing_content = [content[i] for i in missing]
+                missing_vectors = await embedding.batch_vectorize(
+                    config, missing_content
                 )
-
-            # Flatten the results
-            flattened_results = [item for sublist in results for item in sublist]
-
-            # Verify the number of vectors matches the input content
-            if len(flattened_results) != len(content):
-                raise Exception(
-                    f"Mismatch in vectorization results: expected {len(content)} vectors, got {len(flattened_results)}"
+                await offload_executor.run(
+                    embedding_cache.put_many,
+                    embedder,
+                    settings,
+                    missing_content,
+                    missing_vectors,
                 )
-
-            return flattened_results
+                for i, vector in zip(missing, missing_vectors):
+                    vectors[i] = vector
+            return vectors
         except Exception as e:
             raise Exception(f"Batch vectorization failed: {str(e)}")
 
@@ -1163,8 +1388,30 @@ class EmbeddingManager:
         try:
             if embedder in self.embedders:
                 config = rag_config["Embedder"].components[embedder].config
-                embeddings = await self.embedders[embedder].vectorize(config, [content])
-                return embeddings[0]
+                # Repeated queries are served from memory without a round trip
+                key = query_cache.get_key(embedder, config, content)
+                if (vector := query_cache.get(key)) is not None:
+                    return vector
+                settings = get_cache_settings(config)
+                cached = await offload_executor.run(
+                    embedding_cache.get_many, embedder, settings, [content]
+                )
+                if cached[0] is not None:
+                    vector = cached[0].tolist()
+                else:
+                    embeddings = await self.embedders[embedder].vectorize(
+                        config, [content]
+                    )
+                    await offload_executor.run(
+                        embedding_cache.put_many,
+                        embedder,
+                        settings,
+                        [content],
+                        embeddings,
+                    )
+                    vector = np.asarray(embeddings[0], dtype=np.float32).tolist()
+                query_cache.put(key, vector)
+                return vector
             else:
                 raise Exception(f"{embedder} Embedder not found")
         except Exception as e:
@@ -1173,9 +1420,7 @@ class EmbeddingManager:
 
 class RetrieverManager:
     def __init__(self):
-        self.retrievers: dict[str, Retriever] = {
-            retriever.name: retriever for retriever in retrievers
-        }
+        self.retrievers: ComponentRegistry = retrievers
 
     async def retrieve(
         self,
@@ -1217,9 +1462,7 @@ class RetrieverManager:
 
 class GeneratorManager:
     def __init__(self):
-        self.generators: dict[str, Generator] = {
-            generator.name: generator for generator in generators
-        }
+        self.generators: ComponentRegistry = generators
 
     async def generate_stream(self, rag_config, query, context, conversation):
         """Generate a stream of response dicts based on a list of queries and list of contexts, and includes conversational context
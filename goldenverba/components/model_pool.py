@@ -0,0 +1,158 @@
+import asyncio
+import gc
+import threading
+import time
+
+import numpy as np
+from wasabi import msg
+
+from goldenverba.components.executor import offload_executor
+from goldenverba.components.util import get_token
+
+# Comma separated SentenceTransformers models loaded when the server starts
+LOCAL_MODELS = get_token("VERBA_LOCAL_MODELS", "")
+# Seconds after which unused models are unloaded (0 keeps them loaded)
+LOCAL_MODEL_IDLE_TIMEOUT = int(get_token("VERBA_LOCAL_MODEL_IDLE_TIMEOUT", "1800"))
+# Seconds between two checks for idle models
+IDLE_CHECK_INTERVAL = 60
+
+
+class ResidentModel:
+    __slots__ = ("name", "model", "last_used", "lock")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.model = None
+        self.last_used = time.monotonic()
+        # Serializes loading and encoding, a model already uses all cores while encoding
+        self.lock = threading.Lock()
+
+
+class ModelPool:
+    """
+    Keeps SentenceTransformers models loaded, every model is loaded once per process.
+    Models that weren't used for idle_timeout seconds are unloaded to free memory.
+    """
+
+    def __init__(self, idle_timeout: int = LOCAL_MODEL_IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self.models: dict[str, ResidentModel] = {}
+        self.lock = threading.Lock()
+        self.task: asyncio.Task | None = None
+
+    def get_entry(self, name: str) -> ResidentModel:
+        with self.lock:
+            if name not in self.models:
+                self.models[name] = ResidentModel(name)
+            return self.models[name]
+
+    def load(self, entry: ResidentModel):
+        """Load the model of entry if needed, call with entry.lock held"""
+        if entry.model is None:
+            from sentence_transformers import SentenceTransformer
+
+            start_time = time.perf_counter()
+            entry.model = SentenceTransformer(entry.name)
+            msg.good(
+                f"Loaded {entry.name} in {round(time.perf_counter() - start_time, 2)}s"
+            )
+
+    def encode(
+        self,
+        name: str,
+        content: list[str],
+        batch_size: int = 32,
+        normalize: bool = False,
+    ) -> np.ndarray:
+        """Encode content to a float32 matrix with the resident model, blocking, run it in a thread"""
+        entry = self.get_entry(name)
+        with entry.lock:
+            self.load(entry)
+            entry.last_used = time.monotonic()
+            embeddings = entry.model.encode(
+                content,
+                batch_size=batch_size,
+                normalize_embeddings=normalize,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            )
+            entry.last_used = time.monotonic()
+        return np.asarray(embeddings, dtype=np.float32)
+
+    def warm_up_model(self, name: str):
+        entry = self.get_entry(name)
+        with entry.lock:
+            self.load(entry)
+            entry.last_used = time.monotonic()
+
+    def evict_idle(self) -> list[str]:
+        """Unload models that weren't used for idle_timeout seconds"""
+        if self.idle_timeout <= 0:
+            return []
+        now = time.monotonic()
+        evicted = []
+        with self.lock:
+            entries = list(self.models.values())
+        for entry in entries:
+            if now - entry.last_used <= self.idle_timeout:
+                continue
+            # A model that is encoding right now is not idle
+            if not entry.lock.acquire(blocking=False):
+                continue
+            try:
+                if entry.model is not None:
+                    entry.model = None
+                    evicted.append(entry.name)
+            finally:
+                entry.lock.release()
+        if evicted:
+            # Release the weights right away instead of waiting for the next collection
+            gc.collect()
+        for name in evicted:
+            msg.info(f"Unloaded {name} after {self.idle_timeout}s without use")
+        return evicted
+
+    def start(self, models: list[str] | None = None):
+        """Load models in the background and start unloading idle ones"""
+        if models is None:
+            models = [model.strip() for model in LOCAL_MODELS.split(",")]
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(
+                self.run([model for model in models if model])
+            )
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    async def run(self, models: list[str]):
+        for model in models:
+            try:
+                await offload_executor.run(self.warm_up_model, model)
+            except Exception as e:
+                msg.warn(f"Couldn't load {model}: {str(e)}")
+        while True:
+            await asyncio.sleep(IDLE_CHECK_INTERVAL)
+            await offload_executor.run(self.evict_idle)
+
+    def get_report(self) -> dict:
+        now = time.monotonic()
+        with self.lock:
+            return {
+                "idle_timeout": self.idle_timeout,
+                "models": {
+                    entry.name: {
+                        "loaded": entry.model is not None,
+                        "idle": round(now - entry.last_used, 1),
+                    }
+                    for entry in self.models.values()
+                },
+            }
+
+
+model_pool = ModelPool()
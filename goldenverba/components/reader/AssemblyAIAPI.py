@@ -9,6 +9,7 @@ import assemblyai as aai
 
 from goldenverba.components.document import Document, create_document
 from goldenverba.components.interfaces import Reader
+from goldenverba.components.executor import offload_executor
 from goldenverba.server.types import FileConfig
 from goldenverba.components.util import get_environment
 from goldenverba.components.types import InputConfig
@@ -118,7 +119,8 @@ class AssemblyAIReader(Reader):
 
         try:
             transcriber = aai.Transcriber(config=aaiConfig)
-            transcript = transcriber.transcribe(file_bytes)
+            # transcribe uploads and polls synchronously until the transcript is done
+            transcript = await offload_executor.run(transcriber.transcribe, file_bytes)
             if transcript.error:
                 raise Exception(
                     f"AssemblyAI API failed to transcribe {fileConfig.filename}: {transcript.error}"
@@ -4,8 +4,13 @@ import io
 
 from wasabi import msg
 
-from goldenverba.components.document import Document, create_document
+from goldenverba.components.document import (
+    Document,
+    create_document,
+    load_nlp_for_language,
+)
 from goldenverba.components.interfaces import Reader
+from goldenverba.components.executor import offload_executor
 from goldenverba.server.types import FileConfig
 
 # Optional imports with error handling
@@ -39,6 +44,34 @@ except ImportError:
     msg.warn("olefile not installed, DOC functionality may be limited.")
     olefile = None
 
+# Larger JSON files are never parsed at once, the JSON Chunker streams through their text
+MAX_PARSED_JSON_SIZE = 10 * 1024 * 1024
+
+
+def extract_pdf_text(decoded_bytes: bytes) -> str:
+    """Extract text from PDF bytes, runs in the offload executor"""
+    reader = PdfReader(io.BytesIO(decoded_bytes))
+    return "\n\n".join(page.extract_text() for page in reader.pages)
+
+
+def extract_docx_text(decoded_bytes: bytes) -> str:
+    """Extract text from DOCX bytes, runs in the offload executor"""
+    reader = docx.Document(io.BytesIO(decoded_bytes))
+    return "\n".join(paragraph.text for paragraph in reader.paragraphs)
+
+
+def extract_pptx_text(decoded_bytes: bytes) -> str:
+    """Extract text from PPTX bytes, runs in the offload executor"""
+    presentation = Presentation(io.BytesIO(decoded_bytes))
+    slides_text = []
+    for slide in presentation.slides:
+        slide_content = []
+        for shape in slide.shapes:
+            if shape.has_text_frame:
+                slide_content.append(shape.text)
+        slides_text.append("\n".join(slide_content))
+    return "\n\n".join(slides_text)
+
 
 class BasicReader(Reader):
     """
@@ -59,6 +92,8 @@ class BasicReader(Reader):
             ".md",
             ".mdx",
             ".json",
+            ".jsonl",
+            ".ndjson",
             ".pdf",
             ".docx",
             ".pptx",
@@ -83,10 +118,8 @@ class BasicReader(Reader):
             ".hpp",
         ]
 
-        # Initialize spaCy model if available
-        self.nlp = spacy.blank("en") if spacy else None
-        if self.nlp:
-            self.nlp.add_pipe("sentencizer", config={"punct_chars": None})
+        # Use the shared spaCy pipeline if available
+        self.nlp = load_nlp_for_language("en") if spacy else None
 
     async def load(self, config: dict, fileConfig: FileConfig) -> list[Document]:
         """
@@ -137,25 +170,23 @@ class BasicReader(Reader):
     async def load_json_file(
         self, decoded_bytes: bytes, fileConfig: FileConfig
     ) -> list[Document]:
-        """Load and parse a JSON file."""
-        try:
-            json_obj = json.loads(decoded_bytes.decode("utf-8"))
-            document = Document.from_json(json_obj, self.nlp)
-            return (
-                [document]
-                if document
-                else [create_document(json.dumps(json_obj, indent=2), fileConfig)]
-            )
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in {fileConfig.filename}: {str(e)}")
+        """Load a JSON file, small files are checked for exported Verba Documents."""
+        text = decoded_bytes.decode("utf-8")
+        if len(decoded_bytes) <= MAX_PARSED_JSON_SIZE:
+            try:
+                document = Document.from_json(json.loads(text), self.nlp)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON in {fileConfig.filename}: {str(e)}")
+            if document:
+                return [document]
+        # The original text is kept, chunks can point at exact offsets of the file
+        return [create_document(text, fileConfig)]
 
     async def load_pdf_file(self, decoded_bytes: bytes) -> str:
         """Load and extract text from a PDF file."""
         if not PdfReader:
             raise ImportError("pypdf is not installed. Cannot process PDF files.")
-        pdf_bytes = io.BytesIO(decoded_bytes)
-        reader = PdfReader(pdf_bytes)
-        return "\n\n".join(page.extract_text() for page in reader.pages)
+        return await offload_executor.run(extract_pdf_text, decoded_bytes, cpu=True)
 
     async def load_docx_file(self, decoded_bytes: bytes) -> str:
         """Load and extract text from a DOCX file."""
@@ -163,9 +194,7 @@ class BasicReader(Reader):
             raise ImportError(
                 "python-docx is not installed. Cannot process DOCX files."
             )
-        docx_bytes = io.BytesIO(decoded_bytes)
-        reader = docx.Document(docx_bytes)
-        return "\n".join(paragraph.text for paragraph in reader.paragraphs)
+        return await offload_executor.run(extract_docx_text, decoded_bytes, cpu=True)
 
     async def load_pptx_file(self, decoded_bytes: bytes) -> str:
         """Load and extract text from a PPTX file."""
@@ -173,16 +202,7 @@ class BasicReader(Reader):
             raise ImportError(
                 "python-pptx is not installed. Cannot process PPTX files."
             )
-        pptx_bytes = io.BytesIO(decoded_bytes)
-        presentation = Presentation(pptx_bytes)
-        slides_text = []
-        for slide in presentation.slides:
-            slide_content = []
-            for shape in slide.shapes:
-                if shape.has_text_frame:
-                    slide_content.append(shape.text)
-            slides_text.append("\n".join(slide_content))
-        return "\n\n".join(slides_text)
+        return await offload_executor.run(extract_pptx_text, decoded_bytes, cpu=True)
 
     async def load_doc_file(self, decoded_bytes: bytes) -> str:
         """Load and extract text from a DOC file (if supported)."""
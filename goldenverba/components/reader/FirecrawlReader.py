@@ -12,6 +12,7 @@ from goldenverba.server.types import FileConfig
 from goldenverba.components.reader.BasicReader import BasicReader
 from goldenverba.components.util import get_environment
 from goldenverba.components.types import InputConfig
+from goldenverba.components.sessions import http_sessions
 
 
 class FirecrawlReader(Reader):
@@ -112,7 +113,7 @@ class FirecrawlReader(Reader):
             "Authorization": f"Bearer {token}",
         }
 
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             tasks = []
             for url in urls:
                 request_data = {"url": url}
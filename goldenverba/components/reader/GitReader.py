@@ -1,4 +1,3 @@
-import aiohttp
 import os
 import urllib
 import base64
@@ -12,6 +11,7 @@ from goldenverba.components.reader.BasicReader import BasicReader
 from goldenverba.components.util import get_environment
 
 from goldenverba.components.types import InputConfig
+from goldenverba.components.sessions import http_sessions
 
 
 class GitReader(Reader):
@@ -135,7 +135,7 @@ class GitReader(Reader):
         self, url: str, folder: str, token: str, reader: Reader
     ) -> list[str]:
         headers = self.get_headers(token, "GitHub")
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             async with session.get(url, headers=headers) as response:
                 response.raise_for_status()
                 data = await response.json()
@@ -148,7 +148,7 @@ class GitReader(Reader):
 
     async def fetch_docs_gitlab(self, url: str, token: str, reader: Reader) -> list:
         headers = self.get_headers(token, "GitLab")
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             async with session.get(url, headers=headers) as response:
                 response.raise_for_status()
                 data = await response.json()
@@ -166,7 +166,7 @@ class GitReader(Reader):
             f"https://api.github.com/repos/{owner}/{name}/contents/{path}?ref={branch}"
         )
         headers = self.get_headers(token, "GitHub")
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             async with session.get(url, headers=headers) as response:
                 response.raise_for_status()
                 data = await response.json()
@@ -183,7 +183,7 @@ class GitReader(Reader):
         url = f"https://gitlab.com/api/v4/projects/{project_id}/repository/files/{urllib.parse.quote(file_path, safe='')}/raw?ref={branch}"
         headers = {"PRIVATE-TOKEN": token}
 
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             async with session.get(url, headers=headers) as response:
                 if response.status == 200:
                     content = await response.read()
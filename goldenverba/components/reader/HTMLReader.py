@@ -11,6 +11,7 @@ from goldenverba.components.interfaces import Reader
 from goldenverba.server.types import FileConfig
 from goldenverba.components.reader.BasicReader import BasicReader
 from goldenverba.components.types import InputConfig
+from goldenverba.components.sessions import http_sessions
 
 try:
     from markdownify import markdownify as md
@@ -69,7 +70,7 @@ class HTMLReader(Reader):
         documents = []
         processed_urls = set()
 
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             for url in urls:
                 try:
                     await self.process_url(
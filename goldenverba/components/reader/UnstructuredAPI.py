@@ -11,6 +11,7 @@ from goldenverba.components.interfaces import Reader
 from goldenverba.server.types import FileConfig
 from goldenverba.components.util import get_environment
 from goldenverba.components.types import InputConfig
+from goldenverba.components.sessions import http_sessions
 
 
 class UnstructuredReader(Reader):
@@ -89,7 +90,7 @@ class UnstructuredReader(Reader):
         )
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_sessions.session() as session:
                 async with session.post(
                     api_url, headers=headers, data=file_data
                 ) as response:
@@ -0,0 +1,83 @@
+import threading
+import time
+from collections.abc import Mapping
+
+from wasabi import msg
+
+from goldenverba.components.interfaces import VerbaComponent
+
+# Reference point for the startup report, set when the component layer is imported
+IMPORT_TIME = time.perf_counter()
+
+
+class ComponentRegistry(Mapping):
+    """
+    Maps component names to Verba components and only instantiates a component on first access.
+    Records how long every component took to build and when it became ready.
+    """
+
+    def __init__(
+        self, component_type: str, components: dict[str, type[VerbaComponent]]
+    ):
+        self.component_type = component_type
+        self.components = dict(components)
+        self.instances: dict[str, VerbaComponent] = {}
+        self.timings: dict[str, dict] = {}
+        self.lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> VerbaComponent:
+        instance = self.instances.get(name)
+        if instance is None:
+            instance = self.build(name)
+        return instance
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.components
+
+    def __iter__(self):
+        return iter(self.components)
+
+    def __len__(self) -> int:
+        return len(self.components)
+
+    def build(self, name: str) -> VerbaComponent:
+        """Instantiate a registered component, only once per process"""
+        with self.lock:
+            if name in self.instances:
+                return self.instances[name]
+
+            start_time = time.perf_counter()
+            instance = self.components[name]()
+            end_time = time.perf_counter()
+
+            if instance.name != name:
+                msg.warn(
+                    f"{self.component_type} registered as {name} reports name {instance.name}"
+                )
+
+            self.instances[name] = instance
+            self.timings[name] = {
+                "took": round(end_time - start_time, 4),
+                "ready_after": round(end_time - IMPORT_TIME, 4),
+            }
+            msg.info(
+                f"Loaded {self.component_type} {name} in {end_time - start_time:.2f} seconds"
+            )
+            return instance
+
+    def is_built(self, name: str) -> bool:
+        return name in self.instances
+
+    def get_report(self) -> dict:
+        """Return build timings of all registered components, None if not built yet"""
+        return {name: self.timings.get(name) for name in self.components}
+
+
+def get_startup_report(registries: list[ComponentRegistry]) -> dict:
+    """Combine the timings of multiple registries into a single startup report"""
+    return {
+        "uptime": round(time.perf_counter() - IMPORT_TIME, 4),
+        "components": {
+            registry.component_type: registry.get_report() for registry in registries
+        },
+    }
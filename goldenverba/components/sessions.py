@@ -0,0 +1,102 @@
+import asyncio
+import contextlib
+import weakref
+from typing import AsyncIterator
+
+import aiohttp
+from wasabi import msg
+
+from goldenverba.components.util import get_token
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Open connections of all components together and per host
+HTTP_CONNECTIONS = int(get_token("VERBA_HTTP_CONNECTIONS", "100"))
+HTTP_CONNECTIONS_PER_HOST = int(get_token("VERBA_HTTP_CONNECTIONS_PER_HOST", "20"))
+# Idle connections the httpx client keeps open in total, httpx has no limit per host
+HTTP_KEEPALIVE_CONNECTIONS = int(get_token("VERBA_HTTP_KEEPALIVE_CONNECTIONS", "20"))
+# Seconds resolved hosts and idle connections are kept
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 30
+
+
+class SessionRegistry:
+    """
+    HTTP clients shared by all Readers, Embedders and Generators of the process.
+    Connections are kept alive between calls, so only the first request to a host pays for the TCP and TLS handshake.
+    Clients are bound to an event loop, every loop gets its own.
+    """
+
+    def __init__(
+        self,
+        connections: int = HTTP_CONNECTIONS,
+        connections_per_host: int = HTTP_CONNECTIONS_PER_HOST,
+        keepalive_connections: int = HTTP_KEEPALIVE_CONNECTIONS,
+    ):
+        self.connections = connections
+        self.connections_per_host = connections_per_host
+        self.keepalive_connections = keepalive_connections
+        self.sessions: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, aiohttp.ClientSession
+        ] = weakref.WeakKeyDictionary()
+        self.httpx_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, "httpx.AsyncClient"
+        ] = weakref.WeakKeyDictionary()
+
+    def get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        session = self.sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connections,
+                limit_per_host=self.connections_per_host,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            )
+            # Cookies of one provider must not be sent along with requests of another
+            session = aiohttp.ClientSession(
+                connector=connector, cookie_jar=aiohttp.DummyCookieJar()
+            )
+            self.sessions[loop] = session
+        return session
+
+    def get_httpx_client(self) -> "httpx.AsyncClient":
+        loop = asyncio.get_running_loop()
+        client = self.httpx_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.connections,
+                    max_keepalive_connections=self.keepalive_connections,
+                    keepalive_expiry=KEEPALIVE_TIMEOUT,
+                )
+            )
+            self.httpx_clients[loop] = client
+        return client
+
+    @contextlib.asynccontextmanager
+    async def session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Use the shared aiohttp session in place of `async with aiohttp.ClientSession()`, it stays open afterwards"""
+        yield self.get_session()
+
+    @contextlib.asynccontextmanager
+    async def httpx_client(self) -> AsyncIterator["httpx.AsyncClient"]:
+        """Use the shared httpx client in place of `async with httpx.AsyncClient()`, it stays open afterwards"""
+        yield self.get_httpx_client()
+
+    async def close(self):
+        """Close the clients of the running event loop, called when the server shuts down"""
+        loop = asyncio.get_running_loop()
+        session = self.sessions.pop(loop, None)
+        if session is not None and not session.closed:
+            await session.close()
+        client = self.httpx_clients.pop(loop, None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
+        msg.info("Closed shared HTTP sessions")
+
+
+http_sessions = SessionRegistry()
@@ -0,0 +1,36 @@
+import contextlib
+from functools import lru_cache
+
+from wasabi import msg
+
+with contextlib.suppress(Exception):
+    import tiktoken
+
+DEFAULT_ENCODING = "cl100k_base"
+# Characters per token if no tokenizer is available
+CHARACTERS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=None)
+def get_encoding(name: str) -> "tiktoken.Encoding":
+    """Load a tiktoken encoding, every encoding is only created once per process"""
+    return tiktoken.get_encoding(name)
+
+
+@lru_cache(maxsize=None)
+def get_estimation_encoding(name: str) -> "tiktoken.Encoding | None":
+    try:
+        return get_encoding(name)
+    except Exception as e:
+        msg.warn(
+            f"Tokenizer {name} not available ({str(e)}), estimating {CHARACTERS_PER_TOKEN} characters per token"
+        )
+        return None
+
+
+def estimate_tokens(texts: list[str], encoding: str = DEFAULT_ENCODING) -> list[int]:
+    """Estimate the token count of every text, the texts are encoded in parallel threads"""
+    tokenizer = get_estimation_encoding(encoding)
+    if tokenizer is None:
+        return [len(text) // CHARACTERS_PER_TOKEN + 1 for text in texts]
+    return [len(tokens) for tokens in tokenizer.encode_ordinary_batch(texts)]
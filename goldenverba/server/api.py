@@ -19,6 +19,10 @@ from starlette.websockets import WebSocketDisconnect
 from wasabi import msg  # type: ignore[import]
 
 from goldenverba import verba_manager
+from goldenverba.components.executor import offload_executor, loop_lag_monitor
+from goldenverba.components.embedding_cache import embedding_cache
+from goldenverba.components.sessions import http_sessions
+from goldenverba.components.model_pool import model_pool
 
 from goldenverba.server.types import (
     ResetPayload,
@@ -64,8 +68,15 @@ client_manager = verba_manager.ClientManager()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    loop_lag_monitor.start()
+    model_pool.start()
     yield
+    await loop_lag_monitor.stop()
+    await model_pool.stop()
     await client_manager.disconnect()
+    await http_sessions.close()
+    offload_executor.shutdown()
+    embedding_cache.close()
 
 
 # FastAPI App
@@ -161,6 +172,16 @@ async def health_check():
     )
 
 
+@app.get("/api/get_startup_report")
+async def get_startup_report():
+    return JSONResponse(content=manager.get_startup_report())
+
+
+@app.get("/api/get_loop_metrics")
+async def get_loop_metrics():
+    return JSONResponse(content=manager.get_loop_metrics())
+
+
 @app.post("/api/connect")
 async def connect_to_verba(payload: ConnectPayload):
     try:
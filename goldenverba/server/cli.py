@@ -1,6 +1,8 @@
 import click
 import uvicorn
 import os
+import subprocess
+import sys
 from dotenv import load_dotenv
 
 from goldenverba import verba_manager
@@ -36,16 +38,71 @@ def cli():
     default=4,
     help="Workers to run Verba",
 )
-def start(port, host, prod, workers):
+@click.option(
+    "--embedding-server/--no-embedding-server",
+    default=False,
+    help="Start a local embedding server that holds SentenceTransformers models once for all workers.",
+)
+@click.option(
+    "--embedding-server-port",
+    default=8001,
+    help="Port of the local embedding server",
+)
+def start(port, host, prod, workers, embedding_server, embedding_server_port):
     """
     Run the FastAPI application.
     """
+    server = None
+    if embedding_server:
+        server = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "goldenverba.server.cli",
+                "embedding-server",
+                "--port",
+                str(embedding_server_port),
+            ]
+        )
+        # Inherited by all workers, enables the Embedding Server Embedder
+        os.environ["VERBA_EMBEDDING_SERVER_URL"] = (
+            f"http://127.0.0.1:{embedding_server_port}"
+        )
+
+    try:
+        uvicorn.run(
+            "goldenverba.server.api:app",
+            host=host,
+            port=port,
+            reload=(not prod),
+            workers=workers,
+        )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+
+@cli.command("embedding-server")
+@click.option(
+    "--port",
+    default=8001,
+    help="Embedding server port",
+)
+@click.option(
+    "--host",
+    default="127.0.0.1",
+    help="Embedding server host",
+)
+def embedding_server(port, host):
+    """
+    Run the local embedding server shared by all Verba workers.
+    """
     uvicorn.run(
-        "goldenverba.server.api:app",
+        "goldenverba.server.embedding_server:app",
         host=host,
         port=port,
-        reload=(not prod),
-        workers=workers,
+        workers=1,
     )
 
 
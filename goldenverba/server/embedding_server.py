@@ -0,0 +1,125 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import numpy as np
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
+from wasabi import msg
+
+from goldenverba.components.executor import offload_executor
+from goldenverba.components.model_pool import model_pool
+from goldenverba.components.util import get_token
+from goldenverba.server.types import EmbedPayload
+
+# Requests of all Verba workers that arrive within this many seconds are encoded together
+BATCH_WAIT = float(get_token("VERBA_EMBEDDING_SERVER_BATCH_WAIT", "0.005"))
+# Maximum amount of texts encoded at once
+MAX_BATCH_TEXTS = int(get_token("VERBA_EMBEDDING_SERVER_MAX_BATCH", "512"))
+
+
+class EncodeBatcher:
+    """
+    Merges concurrent requests for the same model and settings into one encode call of the ModelPool.
+    """
+
+    def __init__(self, wait: float = BATCH_WAIT, max_texts: int = MAX_BATCH_TEXTS):
+        self.wait = wait
+        self.max_texts = max_texts
+        self.pending: dict[tuple, list[tuple[list[str], asyncio.Future]]] = {}
+        self.tasks: dict[tuple, asyncio.Task] = {}
+
+    async def encode(
+        self, model: str, texts: list[str], batch_size: int, normalize: bool
+    ) -> np.ndarray:
+        key = (model, batch_size, normalize)
+        future = asyncio.get_running_loop().create_future()
+        self.pending.setdefault(key, []).append((texts, future))
+        if key not in self.tasks:
+            self.tasks[key] = asyncio.create_task(self.flush(key))
+        return await future
+
+    async def flush(self, key: tuple):
+        model, batch_size, normalize = key
+        await asyncio.sleep(self.wait)
+        while self.pending.get(key):
+            # Take whole requests until the batch is full, a single large request is encoded alone
+            requests = self.pending[key]
+            count = 1
+            texts = len(requests[0][0])
+            while (
+                count < len(requests)
+                and texts + len(requests[count][0]) <= self.max_texts
+            ):
+                texts += len(requests[count][0])
+                count += 1
+            batch, self.pending[key] = requests[:count], requests[count:]
+
+            try:
+                embeddings = await offload_executor.run(
+                    model_pool.encode,
+                    model,
+                    [text for texts, _ in batch for text in texts],
+                    batch_size,
+                    normalize,
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            start = 0
+            for texts, future in batch:
+                if not future.done():
+                    future.set_result(embeddings[start : start + len(texts)])
+                start += len(texts)
+        del self.pending[key]
+        del self.tasks[key]
+
+
+batcher = EncodeBatcher()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    model_pool.start()
+    yield
+    await model_pool.stop()
+    offload_executor.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+@app.get("/health")
+async def health_check():
+    return JSONResponse(content={"message": "Alive!"})
+
+
+@app.get("/models")
+async def get_models():
+    return JSONResponse(content=model_pool.get_report())
+
+
+@app.post("/embed")
+async def embed(payload: EmbedPayload):
+    """Return the embeddings as float32 matrix, the amount of dimensions is in the X-Embedding-Dimensions header"""
+    if len(payload.texts) == 0:
+        return Response(
+            content=b"",
+            media_type="application/octet-stream",
+            headers={"X-Embedding-Dimensions": "0"},
+        )
+    try:
+        embeddings = await batcher.encode(
+            payload.model, payload.texts, payload.batch_size, payload.normalize
+        )
+    except Exception as e:
+        msg.fail(f"Embedding with {payload.model} failed: {str(e)}")
+        return JSONResponse(status_code=500, content={"error": str(e)})
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+    return Response(
+        content=embeddings.tobytes(),
+        media_type="application/octet-stream",
+        headers={"X-Embedding-Dimensions": str(embeddings.shape[1])},
+    )
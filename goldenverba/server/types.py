@@ -257,3 +257,10 @@ class GetDocumentPayload(BaseModel):
 class ResetPayload(BaseModel):
     resetMode: str
     credentials: Credentials
+
+
+class EmbedPayload(BaseModel):
+    model: str
+    texts: list[str]
+    batch_size: int = 32
+    normalize: bool = False
@@ -14,6 +14,10 @@ from goldenverba.server.helpers import LoggerManager
 from weaviate.client import WeaviateAsyncClient
 
 from goldenverba.components.document import Document
+from goldenverba.components.registry import get_startup_report
+from goldenverba.components.executor import offload_executor, loop_lag_monitor
+from goldenverba.components.embedding_cache import embedding_cache, query_cache
+from goldenverba.components.model_pool import model_pool
 from goldenverba.server.types import (
     FileConfig,
     FileStatus,
@@ -28,6 +32,7 @@ from goldenverba.components.managers import (
     RetrieverManager,
     GeneratorManager,
     WeaviateManager,
+    sum_embedding_statistics,
 )
 
 load_dotenv()
@@ -48,9 +53,7 @@ class VerbaManager:
         self.user_config_uuid = "f53f7738-08be-4d5a-b003-13eb4bf03ac7"
         self.environment_variables = {}
         self.installed_libraries = {}
-
-        self.verify_installed_libraries()
-        self.verify_variables()
+        self.verified = False
 
     async def connect(self, credentials: Credentials, port: str = "8080"):
         start_time = asyncio.get_event_loop().time()
@@ -125,8 +128,16 @@ class VerbaManager:
                 fileConfig.rag_config["Reader"].selected, fileConfig, logger
             )
 
+            await self.chunker_manager.parse_documents(
+                fileConfig.rag_config["Chunker"].selected, documents
+            )
+
+            # Texts shared by several documents of the import are embedded once, keyed by their hash
+            import_vectors = {}
             tasks = [
-                self.process_single_document(client, doc, fileConfig, logger)
+                self.process_single_document(
+                    client, doc, fileConfig, logger, import_vectors
+                )
                 for doc in documents
             ]
 
@@ -134,6 +145,15 @@ class VerbaManager:
             successful_tasks = sum(
                 1 for result in results if not isinstance(result, Exception)
             )
+            # Embedding Statistics of all imported documents, duplicates are counted across the import
+            statistics = sum_embedding_statistics(
+                [
+                    document_statistics
+                    for result in results
+                    if not isinstance(result, Exception)
+                    for document_statistics in result
+                ]
+            )
 
             if successful_tasks > 1:
                 await logger.send_report(
@@ -166,7 +186,7 @@ class VerbaManager:
             await logger.send_report(
                 fileConfig.fileID,
                 status=FileStatus.DONE,
-                message=f"Import for {fileConfig.filename} completed successfully",
+                message=f"Import for {fileConfig.filename} completed successfully ({statistics['embedded']} of {statistics['chunks']} chunks embedded, {statistics['duplicates']} duplicates skipped)",
                 took=round(loop.time() - start_time, 2),
             )
 
@@ -185,7 +205,9 @@ class VerbaManager:
         document: Document,
         fileConfig: FileConfig,
         logger: LoggerManager,
-    ):
+        import_vectors: dict | None = None,
+    ) -> list[dict]:
+        """Import a document of an import, returns the Embedding Statistics of its vectorized documents"""
         loop = asyncio.get_running_loop()
         start_time = loop.time()
 
@@ -230,9 +252,14 @@ class VerbaManager:
                     currentFileConfig,
                     chunked_documents,
                     logger,
+                    import_vectors,
                 )
             )
             vectorized_documents = await embedding_task
+            statistics = [
+                document.meta["Embedding Statistics"]
+                for document in vectorized_documents
+            ]
 
             for document in vectorized_documents:
                 ingesting_task = asyncio.create_task(
@@ -260,6 +287,7 @@ class VerbaManager:
                 message=f"Import for {currentFileConfig.filename} completed successfully",
                 took=round(loop.time() - start_time, 2),
             )
+            return statistics
         except Exception as e:
             await logger.send_report(
                 currentFileConfig.fileID,
@@ -274,6 +302,12 @@ class VerbaManager:
     def create_config(self) -> dict:
         """Creates the RAG Configuration and returns the full Verba Config with also Settings"""
 
+        # Components are only instantiated on first use, verify them once they are needed
+        if not self.verified:
+            self.verify_installed_libraries()
+            self.verify_variables()
+            self.verified = True
+
         available_environments = self.environment_variables
         available_libraries = self.installed_libraries
 
@@ -285,7 +319,7 @@ class VerbaManager:
                 )
                 for reader in readers
             },
-            "selected": list(readers.values())[0].name,
+            "selected": next(iter(readers)),
         }
 
         chunkers = self.chunker_manager.chunkers
@@ -296,7 +330,7 @@ class VerbaManager:
                 )
                 for chunker in chunkers
             },
-            "selected": list(chunkers.values())[0].name,
+            "selected": next(iter(chunkers)),
         }
 
         embedders = self.embedder_manager.embedders
@@ -307,7 +341,7 @@ class VerbaManager:
                 )
                 for embedder in embedders
             },
-            "selected": list(embedders.values())[0].name,
+            "selected": next(iter(embedders)),
         }
 
         retrievers = self.retriever_manager.retrievers
@@ -318,7 +352,7 @@ class VerbaManager:
                 )
                 for retriever in retrievers
             },
-            "selected": list(retrievers.values())[0].name,
+            "selected": next(iter(retrievers)),
         }
 
         generators = self.generator_manager.generators
@@ -329,7 +363,7 @@ class VerbaManager:
                 )
                 for generator in generators
             },
-            "selected": list(generators.values())[0].name,
+            "selected": next(iter(generators)),
         }
 
         return {
@@ -340,6 +374,28 @@ class VerbaManager:
             "Generator": generator_config,
         }
 
+    def get_startup_report(self) -> dict:
+        """Returns import-to-ready timings of all components that were loaded so far"""
+        return get_startup_report(
+            [
+                self.reader_manager.readers,
+                self.chunker_manager.chunkers,
+                self.embedder_manager.embedders,
+                self.retriever_manager.retrievers,
+                self.generator_manager.generators,
+            ]
+        )
+
+    def get_loop_metrics(self) -> dict:
+        """Returns the event loop lag, the work offloaded to the executor and cache statistics"""
+        return {
+            "loop_lag": loop_lag_monitor.get_report(),
+            "executor": offload_executor.get_report(),
+            "embedding_cache": embedding_cache.get_report(),
+            "query_cache": query_cache.get_report(),
+            "local_models": model_pool.get_report(),
+        }
+
     def create_user_config(self) -> dict:
         return {"getting_started": False}
 
@@ -562,6 +618,7 @@ class VerbaManager:
         chunkScores: list[ChunkScore],
     ):
         chunks_per_page = 10
+        characters_per_page = 5000
         content_pieces = []
         total_batches = 0
 
@@ -575,6 +632,43 @@ class VerbaManager:
                 client, chunkScores[page].uuid, chunkScores[page].embedder
             )
 
+            # Chunks with exact offsets are shown with the surrounding document content
+            if chunk.get("start_i") is not None and chunk.get("end_i") is not None:
+                document = await self.weaviate_manager.get_document(
+                    client, uuid, properties=["meta", "content"]
+                )
+                if self.has_exact_offsets(document):
+                    content = document["content"]
+                    start_i, end_i = int(chunk["start_i"]), int(chunk["end_i"])
+                    context_size = int(characters_per_page / 2)
+                    content_pieces.append(
+                        {
+                            "content": content[
+                                max(0, start_i - context_size) : start_i
+                            ],
+                            "chunk_id": 0,
+                            "score": 0,
+                            "type": "text",
+                        }
+                    )
+                    content_pieces.append(
+                        {
+                            "content": content[start_i:end_i],
+                            "chunk_id": chunkScores[page].chunk_id,
+                            "score": chunkScores[page].score,
+                            "type": "extract",
+                        }
+                    )
+                    content_pieces.append(
+                        {
+                            "content": content[end_i : end_i + context_size],
+                            "chunk_id": 0,
+                            "score": 0,
+                            "type": "text",
+                        }
+                    )
+                    return (content_pieces, total_batches)
+
             before_ids = [
                 i
                 for i in range(
@@ -663,8 +757,26 @@ class VerbaManager:
         # Return Content based on Page
         else:
             document = await self.weaviate_manager.get_document(
-                client, uuid, properties=["meta"]
+                client, uuid, properties=["meta", "content"]
             )
+
+            # Pages are sliced from the document content if the chunks are exact slices of it
+            if self.has_exact_offsets(document):
+                content = document["content"]
+                total_batches = int(math.ceil(len(content) / characters_per_page))
+                page_start = page * characters_per_page
+                content_pieces.append(
+                    {
+                        "content": content[
+                            page_start : page_start + characters_per_page
+                        ],
+                        "chunk_id": 0,
+                        "score": 0,
+                        "type": "text",
+                    }
+                )
+                return (content_pieces, total_batches)
+
             config = json.loads(document["meta"])
             embedder = config["Embedder"]["config"]["Model"]["value"]
             request_chunk_ids = [
@@ -699,6 +811,12 @@ class VerbaManager:
 
         return (content_pieces, total_batches)
 
+    def has_exact_offsets(self, document: dict | None) -> bool:
+        """Whether the chunks of a stored document are exact slices of its content"""
+        if document is None:
+            return False
+        return json.loads(document.get("meta", "{}")).get("Exact Offsets", False)
+
     # Retrieval Augmented Generation
 
     async def retrieve_chunks(